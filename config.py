@@ -9,6 +9,17 @@ including default settings, loading from file, and saving to file.
 import json
 # Import the os module for interacting with the operating system, e.g., for file path operations.
 import os
+# Import the logging module for reporting diagnostics.
+import logging
+
+# Use the native orjson parser when it is installed, falling back to the standard library.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Create a logger for this module.
+log = logging.getLogger(__name__)
 
 # Define the path to the configuration file.
 CONFIG_PATH = "config.json"
@@ -34,11 +45,60 @@ DEFAULT = {
 }
 
 
+# Cache of the last loaded configuration, keyed by the config file's modification time.
+_CACHE = {"mtime": None, "cfg": None}
+
+
+# Define a function to parse JSON data with the fastest available parser.
+def json_loads(data):
+    """
+    Parse a JSON document.
+
+    Args:
+        data (bytes): The raw JSON document.
+
+    Returns:
+        The decoded Python object.
+
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON (orjson's error is a subclass).
+    """
+    # Parse with orjson when available, otherwise with the standard library (which also accepts bytes).
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Define a function to serialize data to JSON with the fastest available encoder.
+def json_dumps(obj, indent=True):
+    """
+    Serialize an object to a JSON document.
+
+    Args:
+        obj: The object to serialize.
+        indent (bool): Indent with two spaces if True, otherwise write compact JSON.
+
+    Returns:
+        bytes: The UTF-8 encoded JSON document.
+    """
+    # Serialize with orjson when available; it returns bytes directly.
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    # Otherwise fall back to the standard library and encode the result.
+    if indent:
+        return json.dumps(obj, indent=2).encode("utf-8")
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
 # Define a function to load the configuration from a file.
 def load_config():
     """
     Load configuration from file.
     
+    The parsed configuration is cached and returned as-is by later calls
+    until the file's modification time changes, so callers should treat
+    it as read-only and go through save_config() to change it.
+
     Returns:
         dict: The loaded configuration. If the config file doesn't exist,
               creates it with default values first.
@@ -49,14 +109,25 @@ def load_config():
         save_config(DEFAULT)
     
     try:
-        # Open the configuration file for reading.
-        with open(CONFIG_PATH, "r", encoding="utf-8") as f:
-            # Load the JSON data from the file and return it.
-            return json.load(f)
+        # Get the file's modification time to validate the cached configuration.
+        mtime = os.stat(CONFIG_PATH).st_mtime_ns
+        # Return the cached configuration if the file hasn't changed since it was loaded.
+        if _CACHE["mtime"] == mtime:
+            return _CACHE["cfg"]
+
+        # Open the configuration file for reading in binary mode (orjson parses bytes).
+        with open(CONFIG_PATH, "rb") as f:
+            # Load the JSON data from the file.
+            loaded = json_loads(f.read())
+        # Remember the parsed configuration together with the mtime it was read at.
+        _CACHE["mtime"] = mtime
+        _CACHE["cfg"] = loaded
+        # Return the loaded configuration.
+        return loaded
     # Handle exceptions that may occur during file reading or JSON decoding.
     except (json.JSONDecodeError, IOError) as e:
-        # Print an error message if loading fails.
-        print(f"Error loading config: {e}. Using default configuration.")
+        # Log an error message if loading fails.
+        log.error("Error loading config: %s. Using default configuration.", e)
         # Return a copy of the default configuration as a fallback.
         return DEFAULT.copy()
 
@@ -70,14 +141,27 @@ def save_config(cfg):
         cfg (dict): Configuration dictionary to save.
     """
     try:
-        # Create the directory for the configuration file if it doesn't exist.
-        os.makedirs(os.path.dirname(CONFIG_PATH), exist_ok=True)
-        
-        # Open the configuration file for writing.
-        with open(CONFIG_PATH, "w", encoding="utf-8") as f:
-            # Write the configuration dictionary to the file in JSON format.
-            json.dump(cfg, f, indent=2)
+        # Create the directory for the configuration file if it doesn't exist
+        # (a bare filename has no directory part, and os.makedirs("") would raise).
+        config_dir = os.path.dirname(CONFIG_PATH)
+        if config_dir:
+            os.makedirs(config_dir, exist_ok=True)
+
+        # Write to a temporary file first so a crash mid-write can't corrupt the real config.
+        tmp_path = f"{CONFIG_PATH}.tmp"
+        # Open the temporary file for writing in binary mode.
+        with open(tmp_path, "wb") as f:
+            # Write the configuration dictionary to the file in indented JSON format.
+            f.write(json_dumps(cfg))
+            # Make sure the data has reached the disk before swapping the files.
+            f.flush()
+            os.fsync(f.fileno())
+
+        # Atomically replace the old configuration file with the new one.
+        os.replace(tmp_path, CONFIG_PATH)
+        # Drop the cached configuration; coarse filesystem timestamps may not change on a quick rewrite.
+        _CACHE["mtime"] = None
     # Handle exceptions that may occur during file writing.
     except (IOError, OSError) as e:
-        # Print an error message if saving fails.
-        print(f"Error saving config: {e}")
\ No newline at end of file
+        # Log an error message if saving fails.
+        log.error("Error saving config: %s", e)
\ No newline at end of file
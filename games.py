@@ -3,118 +3,372 @@ games.py
 ---------
 Handles discovering available games for the Retro Launcher.
 It first tries to load `data/games.json` (for metadata and cover URLs).
-If that file doesn't exist, it scans the `roms/` directory automatically.
+The parsed games.json is cached in `data/.games.cache.pkl` and reused
+while games.json is unchanged. If that file doesn't exist, it scans the
+`roms/` directory automatically, reusing the results cached in
+`data/.scan_cache.json` for console folders that haven't changed since
+the last scan. `iter_roms` yields the games in chunks as they are found;
+`scan_roms` returns the full list at once.
 """
 
 # Import the os module for interacting with the operating system, e.g., for file path operations.
 import os
-# Import the json module for working with JSON data.
+# Import the logging module for reporting diagnostics.
+import logging
+# Import the executor used to scan console directories concurrently.
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
+# Import the json module for its JSONDecodeError exception type.
 import json
+# Import the pickle module for the binary cache of the parsed games.json.
+import pickle
+# Import the JSON helpers from the config module, which use orjson when it is installed.
+from config import json_dumps, json_loads
 
-# Define a tuple of supported ROM file extensions that the launcher recognizes.
-SUPPORTED_EXTS = (".nes", ".smc", ".sfc", ".gba", ".gbc", ".gb")
+# Create a logger for this module.
+log = logging.getLogger(__name__)
 
+# Define the set of supported (lowercase) ROM file extensions that the launcher recognizes.
+SUPPORTED_EXTS = frozenset({".nes", ".smc", ".sfc", ".gba", ".gbc", ".gb"})
 
-# Define a function to scan for ROMs, taking the configuration as an argument.
-def scan_roms(cfg):
+# Define the path of the binary cache holding the parsed contents of data/games.json.
+GAMES_CACHE_FILE = os.path.join("data", ".games.cache.pkl")
+
+# Define the path of the cache holding the results of previous ROM folder scans.
+SCAN_CACHE_FILE = os.path.join("data", ".scan_cache.json")
+# Bump this whenever the layout of cached game entries changes.
+SCAN_CACHE_VERSION = 2
+# Define how many console directories are scanned concurrently (the GIL is released during I/O).
+SCAN_WORKERS = 4
+# Define how often (in seconds) a pending folder scan checks whether the caller asked to stop.
+STOP_POLL_S = 0.1
+
+
+# Define a function to load the parsed games.json from the binary cache.
+def _load_games_cache(stamp):
     """
-    Loads the game list either from data/games.json or by scanning rom folders.
+    Loads the cached game list parsed from data/games.json.
 
     Args:
-        cfg (dict): The configuration dictionary (from config.json)
+        stamp (tuple): Identifies the games.json contents the cache must have been built from.
     Returns:
-        list of dict: Each game has keys like name, console, rom_path, image_url...
+        list of dict or None: The cached games, or None if the cache is missing or stale.
+    """
+    try:
+        # Open the cache file for reading in binary mode.
+        with open(GAMES_CACHE_FILE, "rb") as f:
+            # Deserialize the stamp and the games in one step; there is no text to parse.
+            cached_stamp, games = pickle.load(f)
+    # A missing, truncated, or incompatible cache simply means games.json gets parsed again.
+    except (OSError, EOFError, ValueError, TypeError, AttributeError, pickle.UnpicklingError):
+        return None
+    # Only use the cache if it was built from the current games.json.
+    return games if cached_stamp == stamp else None
+
+
+# Define a function to save the parsed games.json to the binary cache.
+def _save_games_cache(stamp, games):
+    """
+    Saves the game list parsed from data/games.json.
+
+    Args:
+        stamp (tuple): Identifies the games.json contents the games were parsed from.
+        games (list of dict): The processed games.
+    """
+    try:
+        # Open the cache file for writing in binary mode.
+        with open(GAMES_CACHE_FILE, "wb") as f:
+            # Serialize with pickle protocol 5, which loads much faster than JSON can be parsed.
+            pickle.dump((stamp, games), f, protocol=5)
+    # Failing to write the cache only costs parsing games.json again next time.
+    except OSError as e:
+        # Log a warning message if saving fails.
+        log.warning("Could not save games cache: %s", e)
+
+
+# Define a function to load the ROM scan cache from disk.
+def _load_scan_cache():
+    """
+    Loads the cached ROM folder scan results.
+
+    Returns:
+        dict: Maps each console directory path to its cached {"mtime", "games"} entry.
+              Empty if the cache is missing, unreadable, or from another schema version.
+    """
+    try:
+        # Open the cache file for reading in binary mode.
+        with open(SCAN_CACHE_FILE, "rb") as f:
+            # Load the cached scan data.
+            cache = json_loads(f.read())
+    # A missing or corrupt cache simply means everything gets rescanned.
+    except (json.JSONDecodeError, IOError):
+        return {}
+
+    # Ignore caches written with a different entry layout.
+    if not isinstance(cache, dict) or cache.get("schema_version") != SCAN_CACHE_VERSION:
+        return {}
+    # Return the per-console entries.
+    return cache.get("consoles", {})
+
+
+# Define a function to save the ROM scan cache to disk.
+def _save_scan_cache(consoles):
+    """
+    Saves the ROM folder scan results for the next launch.
+
+    Args:
+        consoles (dict): Maps each console directory path to its {"mtime", "games"} entry.
+    """
+    try:
+        # Create the directory for the cache file if it doesn't exist.
+        os.makedirs(os.path.dirname(SCAN_CACHE_FILE), exist_ok=True)
+        # Open the cache file for writing in binary mode.
+        with open(SCAN_CACHE_FILE, "wb") as f:
+            # Write compact JSON (no indentation) so the cache stays small and fast to reload.
+            f.write(json_dumps(
+                {"schema_version": SCAN_CACHE_VERSION, "consoles": consoles},
+                indent=False,
+            ))
+    # Failing to write the cache only costs a full rescan next time.
+    except (IOError, OSError) as e:
+        # Log a warning message if saving fails.
+        log.warning("Could not save ROM scan cache: %s", e)
+
+
+# Define a function to scan a single console directory for ROM files.
+def _scan_console(console, cpath):
+    """
+    Scans one console directory for supported ROM files.
+
+    Args:
+        console (str): The console type, taken from the directory name.
+        cpath (str): The absolute path to the console directory; entry paths inherit it.
+    Returns:
+        list of dict: The games found in the directory, sorted by filename.
+    """
+    # Initialize an empty list to store the games found in this directory.
+    games = []
+
+    # Collect (filename, game name, path) for every ROM in the directory.
+    roms = []
+    # Scan the console directory, keeping regular files with a supported ROM extension.
+    with os.scandir(cpath) as it:
+        for entry in it:
+            # Locate the extension once; the part before it is the game name.
+            file = entry.name
+            dot = file.rfind(".")
+            # Skip names without an extension and dotfiles such as ".nes", which have no game name.
+            if dot <= 0:
+                continue
+            # Only the short extension is lowercased, then checked against the set in O(1);
+            # is_file() reuses the file type cached from readdir.
+            if file[dot:].lower() in SUPPORTED_EXTS and entry.is_file():
+                roms.append((file, file[:dot], entry.path))
+
+    # Iterate over the ROM entries, sorted alphabetically by filename.
+    for file, name, rom_path in sorted(roms):
+
+        # Append a new dictionary representing the discovered game to the 'games' list.
+        games.append({
+            # Create a unique key for the game using console and name.
+            "key": f"{console}::{name}",
+            # Store the extracted game name.
+            "name": name,
+            # Store the console type.
+            "console": console,
+            # Store the original filename.
+            "file": file,
+            # Store the absolute path to the ROM file.
+            "rom_path": rom_path
+        })
+
+    # Return the games found in this console directory.
+    return games
+
+
+# Define a helper that loads the games listed in data/games.json.
+def _load_games_json(data_file):
     """
+    Loads the games listed in games.json, using the pickle cache while the file is unchanged.
 
-    # Construct the absolute path to the games.json file within the 'data' directory.
-    data_file = os.path.join("data", "games.json")
+    Args:
+        data_file (str): The path of games.json.
+    Returns:
+        list of dict: The valid games; empty if the file is missing, empty, or unreadable.
+    """
     # Initialize an empty list to store game information.
     games = []
 
+    try:
+        # Get the file's metadata; this also tells us whether it exists.
+        st = os.stat(data_file)
+    except OSError:
+        return games
+
+    # Relative ROM paths are resolved against the working directory, so it is part of the stamp.
+    stamp = (st.st_mtime_ns, st.st_size, os.getcwd())
+    # Reuse the previously parsed games if games.json hasn't changed since.
+    cached = _load_games_cache(stamp)
+    if cached is not None:
+        return cached
+
+    # Parse games.json since the cache couldn't be used.
+    try:
+        # Open the games.json file for reading in binary mode (orjson parses bytes).
+        with open(data_file, "rb") as f:
+            # Load the JSON data from the file into the 'loaded' variable.
+            loaded = json_loads(f.read())
+
+            # Iterate over each game entry in the loaded data.
+            for g in loaded:
+                # Get the console type (e.g., NES, SNES, GBA) for the current game.
+                console = g.get("console")
+                # Get the full path to the ROM file for the current game.
+                path = g.get("rom_path")
+
+                # Skip invalid entries that do not have sufficient information (missing console or path).
+                if not console or not path:
+                    # Log a warning message for invalid entries.
+                    log.warning("Skipping invalid entry (missing console/path): %s", g)
+                    # Move to the next iteration of the loop.
+                    continue
+
+                # Convert relative ROM paths to absolute paths for consistent handling.
+                if not os.path.isabs(path):
+                    # Convert the relative path to an absolute path.
+                    path = os.path.abspath(path)
+
+                # Ensure a unique "key" exists for internal use, generating one if missing.
+                g["rom_path"] = path
+                g["key"] = g.get("key", f"{console}::{g.get('name', 'Unknown')}")
+                # Add the processed game dictionary to the 'games' list.
+                games.append(g)
+
+        # Cache the processed games so the next launch can skip parsing games.json.
+        if games:
+            _save_games_cache(stamp, games)
+
+    # Catch exceptions related to JSON decoding errors or I/O operations.
+    except (json.JSONDecodeError, IOError) as e:
+        # Log an error message if loading from games.json fails.
+        log.error("Error loading data/games.json: %s", e)
+
+    # Return the games loaded from the file.
+    return games
+
+
+# Define a generator that discovers the available games, chunk by chunk.
+def iter_roms(cfg, should_stop=None):
+    """
+    Loads the game list either from data/games.json or by scanning rom folders,
+    yielding it in chunks as soon as each part is available.
+
+    Console folders are yielded one at a time in alphabetical order, so the
+    concatenated chunks always equal the result of scan_roms().
+
+    Args:
+        cfg (dict): The configuration dictionary (from config.json)
+        should_stop (callable, optional): Polled while waiting for folder scans; when it
+            returns True the generator stops without waiting for the remaining scans.
+    Yields:
+        list of dict: Non-empty chunks of games with keys like name, console, rom_path, image_url...
+    """
+
     # ----- CASE 1: Attempt to load game data from games.json -----
-    # Check if the games.json file exists at the specified path.
-    if os.path.exists(data_file):
-        try:
-            # Open the games.json file for reading with UTF-8 encoding.
-            with open(data_file, "r", encoding="utf-8") as f:
-                # Load the JSON data from the file into the 'loaded' variable.
-                loaded = json.load(f)
-
-                # Iterate over each game entry in the loaded data.
-                for g in loaded:
-                    # Get the console type (e.g., NES, SNES, GBA) for the current game.
-                    console = g.get("console")
-                    # Get the full path to the ROM file for the current game.
-                    path = g.get("rom_path")
-
-                    # Skip invalid entries that do not have sufficient information (missing console or path).
-                    if not console or not path:
-                        # Print a warning message for invalid entries.
-                        print(f"⚠️  Skipping invalid entry (missing console/path): {g}")
-                        # Move to the next iteration of the loop.
-                        continue
-
-                    # Convert relative ROM paths to absolute paths for consistent handling.
-                    if not os.path.isabs(path):
-                        # Convert the relative path to an absolute path.
-                        path = os.path.abspath(path)
-
-                    # Ensure a unique "key" exists for internal use, generating one if missing.
-                    g["rom_path"] = path
-                    g["key"] = g.get("key", f"{console}::{g.get('name', 'Unknown')}")
-                    # Add the processed game dictionary to the 'games' list.
-                    games.append(g)
-
-        # Catch exceptions related to JSON decoding errors or I/O operations.
-        except (json.JSONDecodeError, IOError) as e:
-            # Print an error message if loading from games.json fails.
-            print(f"❌ Error loading data/games.json: {e}")
+    games = _load_games_json(os.path.join("data", "games.json"))
+    if games:
+        # games.json is parsed (or unpickled) as a whole, so it arrives as a single chunk.
+        log.info("Loaded %d games.", len(games))
+        yield games
+        return
 
     # ----- CASE 2: If no games were loaded from JSON, scan ROM folders -----
-    # Check if the 'games' list is still empty, indicating games.json was not loaded or was empty/corrupt.
-    if not games:
-        # Get the ROMs directory from the configuration, defaulting to "roms" if not specified.
-        roms_dir = cfg.get("roms_dir", "roms")
-
-        # Check if the specified ROMs directory exists and is a directory.
-        if not os.path.isdir(roms_dir):
-            # Print a warning if the ROMs directory is not found.
-            print("⚠️  No ROMs directory found:", roms_dir)
-            # Return an empty list as no ROMs could be scanned.
-            return []
-
-        # Iterate over each console subdirectory within the ROMs directory, sorted alphabetically.
-        for console in sorted(os.listdir(roms_dir)):
-            # Construct the full path to the current console directory.
-            cpath = os.path.join(roms_dir, console)
-            # Skip if the current path is not a directory.
-            if not os.path.isdir(cpath):
-                continue
+    # Get the ROMs directory from the configuration, defaulting to "roms" if not specified.
+    roms_dir = cfg.get("roms_dir", "roms")
 
-            # Iterate over each file within the current console directory, sorted alphabetically.
-            for file in sorted(os.listdir(cpath)):
-                # Check if the file's extension is among the supported ROM extensions (case-insensitive).
-                if file.lower().endswith(SUPPORTED_EXTS):
-                    # Extract the game name from the filename (without the extension).
-                    name = os.path.splitext(file)[0]
-                    # Construct the absolute path to the ROM file.
-                    rom_path = os.path.abspath(os.path.join(cpath, file))
-
-                    # Append a new dictionary representing the discovered game to the 'games' list.
-                    games.append({
-                        # Create a unique key for the game using console and name.
-                        "key": f"{console}::{name}",
-                        # Store the extracted game name.
-                        "name": name,
-                        # Store the console type.
-                        "console": console,
-                        # Store the original filename.
-                        "file": file,
-                        # Store the absolute path to the ROM file.
-                        "rom_path": rom_path
-                    })
-
-    # Print a confirmation message indicating the total number of games loaded.
-    print(f"✅ Loaded {len(games)} games.")
-    # Return the final list of discovered games.
-    return games
+    # Check if the specified ROMs directory exists and is a directory.
+    if not os.path.isdir(roms_dir):
+        # Log a warning if the ROMs directory is not found.
+        log.warning("No ROMs directory found: %s", roms_dir)
+        # Stop as no ROMs could be scanned.
+        return
+
+    # Resolve the ROMs directory once: os.scandir entries inherit an absolute parent path,
+    # so no per-file os.path.abspath() (and its os.getcwd() call) is needed.
+    roms_dir_abs = os.path.abspath(roms_dir)
+
+    # Enumerate the console subdirectories once with os.scandir; DirEntry.is_dir() reuses the
+    # file type reported by readdir, so no extra stat() call is needed per entry.
+    with os.scandir(roms_dir_abs) as it:
+        # Keep only directories, sorted alphabetically by console name.
+        consoles = sorted((e for e in it if e.is_dir()), key=lambda e: e.name)
+
+    # Load the results of the previous scan and prepare the cache for this one.
+    cache = _load_scan_cache()
+    new_cache = {}
+    # Console directories (name, path, cache key) that changed and need to be rescanned.
+    stale = []
+
+    # Iterate over each console subdirectory within the ROMs directory.
+    for console_entry in consoles:
+        # A directory's mtime changes whenever files are added, removed, or renamed in it.
+        mtime = console_entry.stat().st_mtime_ns
+        # Key the cache by the console directory's absolute path, matching the cached ROM paths.
+        cache_key = console_entry.path
+
+        # Reuse the cached games if the directory hasn't changed; otherwise schedule a rescan.
+        cached = cache.get(cache_key)
+        if cached and cached.get("mtime") == mtime:
+            new_cache[cache_key] = cached
+        else:
+            new_cache[cache_key] = {"mtime": mtime, "games": []}
+            stale.append((console_entry.name, console_entry.path, cache_key))
+
+    # Count the games yielded so far for the final log message.
+    total = 0
+    # Rescan the changed directories concurrently so slow (e.g. network) I/O overlaps;
+    # the executor only starts threads when scans are submitted.
+    pool = ThreadPoolExecutor(max_workers=SCAN_WORKERS)
+    try:
+        # Submit one scan per directory, keyed by the cache entry it fills.
+        futures = {cache_key: pool.submit(_scan_console, console, cpath) for console, cpath, cache_key in stale}
+        # Yield the directories in console order, waiting for each rescan only when its turn comes
+        # so the result is deterministic regardless of completion order.
+        for cache_key, entry in new_cache.items():
+            if cache_key in futures:
+                # Wait in short steps so a stop request is noticed while a slow folder is still being read.
+                while True:
+                    try:
+                        entry["games"] = futures[cache_key].result(timeout=STOP_POLL_S)
+                        break
+                    except FutureTimeout:
+                        if should_stop is not None and should_stop():
+                            # Drop the queued scans and return without saving the incomplete cache.
+                            pool.shutdown(wait=False, cancel_futures=True)
+                            return
+            if entry["games"]:
+                total += len(entry["games"])
+                yield entry["games"]
+    finally:
+        # Release the worker threads (a no-op after an early stop).
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    # Only rewrite the cache file when something changed since the last scan.
+    if new_cache != cache:
+        _save_scan_cache(new_cache)
+
+    # Log a confirmation message indicating the total number of games loaded.
+    log.info("Loaded %d games.", total)
+
+
+# Define the main function to scan for ROMs.
+def scan_roms(cfg):
+    """
+    Loads the game list either from data/games.json or by scanning rom folders.
+
+    Args:
+        cfg (dict): The configuration dictionary (from config.json)
+    Returns:
+        list of dict: Each game has keys like name, console, rom_path, image_url...
+    """
+    # Concatenate every chunk produced by the generator.
+    return [g for chunk in iter_roms(cfg) for g in chunk]
@@ -6,14 +6,106 @@ Thread-safe asynchronous image downloader for game covers.
 
 # Import the os module for interacting with the operating system, e.g., for file path operations.
 import os
-# Import the threading module for creating and managing threads.
+# Import the logging module for reporting diagnostics.
+import logging
+# Import the re module for the precompiled RAWG response pattern.
+import re
+# Import hashlib to derive fixed-length cover filenames from game keys.
+import hashlib
+# Import heapq for the priority queue of pending cover jobs.
+import heapq
+# Import itertools for the tie-breaking sequence numbers of queued jobs.
+import itertools
+# Import the threading module for the queue lock.
 import threading
 # Import the requests library for making HTTP requests.
 import requests
+# Import HTTPAdapter to configure connection pooling for the shared session.
+from requests.adapters import HTTPAdapter
+# Import Retry to transparently retry transient HTTP failures.
+from urllib3.util.retry import Retry
 # Import quote_plus from urllib.parse for URL encoding.
-from urllib.parse import quote_plus
+from urllib.parse import quote_plus, urlsplit
 # Import QObject and pyqtSignal from PyQt5.QtCore for Qt-related object and signal/slot mechanisms.
-from PyQt5.QtCore import QObject, pyqtSignal
+from PyQt5.QtCore import Qt, QObject, QRunnable, QSize, QThreadPool, pyqtSignal
+# Import QImage and QImageReader for decoding covers off the GUI thread (QImage is thread-safe).
+from PyQt5.QtGui import QImage, QImageReader
+# Import the JSON parser helper used to unescape the extracted RAWG image URL.
+from config import json_loads
+
+# Create a logger for this module.
+log = logging.getLogger(__name__)
+
+# Matches the first "background_image" string in a RAWG search response, allowing escaped characters.
+_BACKGROUND_IMAGE = re.compile(rb'"background_image"\s*:\s*"((?:[^"\\]|\\.)*)"')
+
+# Covers up to this size (in bytes) are read in one piece; larger or unsized bodies are streamed.
+STREAM_THRESHOLD = 2_000_000
+
+# Maximum number of covers downloaded concurrently; the jobs are IO-bound, so oversubscribe the CPUs.
+MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Maximum number of requests in flight to any single host, to stay clear of remote throttling.
+PER_HOST_LIMIT = 8
+
+# Shared HTTP session so every worker reuses keep-alive connections to the same hosts.
+_SESSION = requests.Session()
+# Identify the launcher to the RAWG API and the cover CDNs.
+_SESSION.headers.update({"User-Agent": "RetroLauncher/1"})
+# Pool connections per host and retry rate-limited or temporarily unavailable responses.
+_ADAPTER = HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=16,
+    max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[429, 502, 503, 504]),
+)
+# Use the pooled adapter for both plain and secure cover URLs.
+_SESSION.mount("https://", _ADAPTER)
+_SESSION.mount("http://", _ADAPTER)
+
+# Host of the RAWG API, which covers without a direct URL are looked up on.
+RAWG_HOST = "api.rawg.io"
+
+
+# Define a helper returning the host a cover download talks to first.
+def _job_host(image_url: str, use_rawg: bool):
+    """
+    Returns the host a cover download starts with, which its per-host limit is counted against.
+
+    Args:
+        image_url (str): The direct cover URL, if any.
+        use_rawg (bool): Whether covers without a direct URL are looked up through RAWG.
+
+    Returns:
+        str: The host name (and port), or None if the job makes no request.
+    """
+    # A direct URL is tried first.
+    if image_url:
+        return urlsplit(image_url).netloc
+    # Otherwise the cover is looked up (and then downloaded) through RAWG, if a key is set.
+    return RAWG_HOST if use_rawg else None
+
+
+# Define the runnable that performs one cover job on a Qt thread pool thread.
+class _FetchTask(QRunnable):
+    """Runs an ImageFetcher method (normally the next queued cover job) on a QThreadPool thread."""
+
+    # Initialize the task with the fetcher method to run and its arguments.
+    def __init__(self, func, *args):
+        # Call the constructor of the parent class (QRunnable).
+        super().__init__()
+        # Store the fetcher method that performs the job.
+        self.func = func
+        # Store the arguments passed to it.
+        self.args = args
+
+    # Define the method executed by the thread pool.
+    def run(self) -> None:
+        try:
+            # Run the job on this pool thread.
+            self.func(*self.args)
+        # PyQt aborts the process on exceptions escaping QRunnable.run(), so log them instead.
+        except Exception:
+            log.exception("Cover job %s failed", getattr(self.func, "__name__", self.func))
 
 
 # Define the ImageFetcher class, which inherits from QObject to utilize Qt's signal/slot system.
@@ -21,101 +113,327 @@ class ImageFetcher(QObject):
     """
     Downloads and caches cover images for games.
 
-    Emits a signal `image_ready(game_key, local_path)` when an image is 
-    successfully downloaded.
+    Emits a signal `image_ready(game_key, image)` when an image has been
+    downloaded or found cached on disk; the cover is decoded on the worker
+    thread, already scaled down to `decode_size`. Nothing is emitted if no
+    cover could be found.
+
+    Pending jobs run in priority order (lower values first), and the
+    priority of a job that hasn't started yet can be changed with
+    `reprioritize()`, e.g. as the user scrolls. A download whose host
+    already has PER_HOST_LIMIT jobs running is passed over until one of
+    them finishes, so pool threads go to other hosts and cached covers
+    instead of waiting.
     """
 
-    # Define a PyQt signal that will be emitted when an image is ready, carrying the game key and local path.
-    image_ready = pyqtSignal(str, str)
+    # Define a PyQt signal that will be emitted when an image is ready, carrying the game key and decoded image.
+    image_ready = pyqtSignal(str, QImage)
 
     # Initialize the ImageFetcher instance.
-    def __init__(self, cfg: dict):
+    def __init__(self, cfg: dict, decode_size: QSize = None):
         # Call the constructor of the parent class (QObject).
         super().__init__()
         # Store the configuration dictionary.
         self.cfg = cfg
+        # Store the size downloaded covers are decoded to fit (None keeps their original size).
+        self.decode_size = decode_size
         # Get the covers directory from the configuration, defaulting to "resources/covers".
         self.covers_dir = self.cfg.get("covers_dir", "resources/covers")
         # Create the covers directory if it doesn't already exist.
         os.makedirs(self.covers_dir, exist_ok=True)
+        # Index the covers that are already on disk so cache hits don't need a stat() per game.
+        self._existing = set(os.listdir(self.covers_dir))
         # Get and strip the RAWG API key from the configuration.
         self.api_key = self.cfg.get("rawg_api_key", "").strip()
+        # Use Qt's global thread pool, which reuses its threads; running jobs are waited on at application
+        # exit, so shutdown() drops the queued ones first.
+        self._pool = QThreadPool.globalInstance()
+        # Bound the number of concurrent downloads.
+        self._pool.setMaxThreadCount(MAX_WORKERS)
+        # Keys of the games whose covers have already been requested.
+        self._requested = set()
+        # Heap of (priority, sequence, key) entries; entries whose priority is out of date are skipped.
+        self._queue = []
+        # Pending jobs and their current priorities by game key, and the number of running jobs per host,
+        # guarded by a lock together with the heap.
+        self._jobs = {}
+        self._priorities = {}
+        self._host_load = {}
+        self._queue_lock = threading.Lock()
+        # Sequence numbers keep jobs of equal priority in request order.
+        self._seq = itertools.count()
 
     # Define the fetch method to start a background image download.
-    def fetch(self, game_key: str, game_name: str, image_url: str = None) -> None:
-        """Starts a background thread to fetch an image for a game."""
-        # Determine the local path where the image should be saved.
-        local_path = self._local_path_for(game_key)
+    def fetch(self, game_key: str, game_name: str, image_url: str = None, priority: int = 0) -> None:
+        """
+        Queues a background download of the cover image for a game.
 
-        # If the image already exists locally, emit the signal immediately and return.
-        if os.path.exists(local_path):
-            self.image_ready.emit(game_key, local_path)
-            return
+        Args:
+            game_key (str): The game's unique key.
+            game_name (str): The game's display name, used for the RAWG lookup.
+            image_url (str, optional): A direct cover URL to try first.
+            priority (int): Jobs with lower values run first; 0 is the most urgent.
+        """
+        # Determine the local filename and path where the image should be saved.
+        filename = self._filename_for(game_key)
+        local_path = self._local_path_for(filename)
+
+        # If the cover was on disk at startup (or downloaded since), decode it on the thread pool;
+        # anything else is checked by the worker, so the GUI thread never stats files.
+        if filename in self._existing:
+            job = (self._decode_cached, (game_key, local_path), None)
+        # Otherwise download it on the thread pool, counted against the host it talks to first.
+        else:
+            job = (self._worker, (game_key, game_name, image_url, local_path),
+                   _job_host(image_url, bool(self.api_key)))
+
+        # Queue the job under its priority.
+        with self._queue_lock:
+            self._jobs[game_key] = job
+            self._priorities[game_key] = priority
+            heapq.heappush(self._queue, (priority, next(self._seq), game_key))
+        # Start one pool task per job; each runs the most urgent queued jobs it may start.
+        self._pool.start(_FetchTask(self._run_next))
+
+    # Define a method to fetch covers for a window of games, skipping ones already requested.
+    def prefetch(self, games, priorities: dict = None) -> None:
+        """
+        Requests the covers for the given games, typically the ones near the viewport.
 
-        # Create a new background thread to perform the image fetching.
-        thread = threading.Thread(
-            target=self._worker,
-            args=(game_key, game_name, image_url, local_path),
-            daemon=True, # Set the thread as a daemon so it exits when the main program exits.
-        )
-        # Start the background thread.
-        thread.start()
+        Games whose cover was requested before are skipped, so the caller can pass the whole
+        visible window every time the view scrolls.
+
+        Args:
+            games (iterable of dict): Game dictionaries with "key", "name", and optional "image_url".
+            priorities (dict, optional): Priority by game key; missing games get priority 0.
+        """
+        # Iterate over the games in the requested window.
+        for g in games:
+            # Skip games whose cover has already been requested.
+            if g["key"] in self._requested:
+                continue
+            # Remember the request and start fetching the cover.
+            self._requested.add(g["key"])
+            self.fetch(g["key"], g["name"], g.get("image_url"),
+                       priorities.get(g["key"], 0) if priorities else 0)
+
+    # Define a method that cancels every cover job that hasn't started yet.
+    def shutdown(self) -> None:
+        """
+        Drops all queued cover jobs so application exit only waits for the ones already running.
+        """
+        # Forget the pending jobs; pool tasks that still start find the queue empty and return.
+        with self._queue_lock:
+            self._jobs.clear()
+            self._priorities.clear()
+            self._queue.clear()
+        # Remove the pool tasks that haven't started.
+        self._pool.clear()
+
+    # Define a method to change the priority of covers that haven't started loading yet.
+    def reprioritize(self, priorities: dict) -> None:
+        """
+        Updates the priority of pending jobs; jobs that already started are unaffected.
+
+        Args:
+            priorities (dict): New priority by game key (lower values run first).
+        """
+        with self._queue_lock:
+            # Iterate over the requested priorities.
+            for key, priority in priorities.items():
+                # Only requeue pending jobs whose priority actually changes; the old heap entry goes stale.
+                if key in self._jobs and self._priorities[key] != priority:
+                    self._priorities[key] = priority
+                    heapq.heappush(self._queue, (priority, next(self._seq), key))
+            # Rebuild the heap once stale entries outnumber the pending jobs, so repeated scrolling
+            # can't grow it beyond about twice the number of pending jobs.
+            if len(self._queue) > 2 * len(self._jobs):
+                self._compact_queue()
+
+    # Define a helper that drops the stale entries from the heap; the caller holds the queue lock.
+    def _compact_queue(self) -> None:
+        """Rebuilds the heap with exactly one entry per pending job, at its current priority."""
+        # Keep the first entry that matches each pending job's current priority.
+        live = {}
+        for entry in self._queue:
+            priority, _, key = entry
+            if key in self._jobs and self._priorities[key] == priority and key not in live:
+                live[key] = entry
+        # Restore the heap invariant over the remaining entries.
+        self._queue = list(live.values())
+        heapq.heapify(self._queue)
+
+    # Define the pool task body that runs the most urgent queued jobs.
+    def _run_next(self) -> None:
+        """
+        Pool worker that runs the job with the lowest priority whose host isn't saturated,
+        then keeps taking jobs until none can start.
+
+        Jobs passed over because their host is saturated are started by the tasks
+        running that host's jobs once they finish, so none is left behind.
+        """
+        while True:
+            # Take the next job that may start, if any.
+            job = self._take_next()
+            if job is None:
+                return
+            func, args, host = job
+            try:
+                # Run the job outside the lock.
+                func(*args)
+            # Log a failed job and carry on, so the jobs this task would start next aren't left behind.
+            except Exception:
+                log.exception("Cover job %s failed", func.__name__)
+            finally:
+                # Give the host's slot back.
+                if host is not None:
+                    with self._queue_lock:
+                        self._host_load[host] -= 1
+
+    # Define a helper that takes the most urgent job that may start off the queue.
+    def _take_next(self):
+        """
+        Returns:
+            tuple: The (func, args, host) of the job to run, or None if no queued job may start.
+        """
+        with self._queue_lock:
+            # Entries of jobs whose host is saturated, put back once the job has been picked.
+            skipped = []
+            job = None
+            # Pop entries until one matches a pending job's current priority and may start.
+            while self._queue:
+                entry = heapq.heappop(self._queue)
+                priority, _, key = entry
+                # Drop stale entries.
+                if key not in self._jobs or self._priorities[key] != priority:
+                    continue
+                # Pass over jobs whose host already has PER_HOST_LIMIT jobs running.
+                host = self._jobs[key][2]
+                if host is not None and self._host_load.get(host, 0) >= PER_HOST_LIMIT:
+                    skipped.append(entry)
+                    continue
+                # Take the job out of the queue and count it against its host.
+                job = self._jobs.pop(key)
+                del self._priorities[key]
+                if host is not None:
+                    self._host_load[host] = self._host_load.get(host, 0) + 1
+                break
+            # Requeue the passed-over jobs.
+            for entry in skipped:
+                heapq.heappush(self._queue, entry)
+        return job
+
+    # Define the worker method that runs on a pool thread to decode a cover cached on disk.
+    def _decode_cached(self, key: str, local_path: str) -> None:
+        """Pool worker that decodes a cached cover and emits it."""
+        # Decode the cover off the GUI thread.
+        img = self._decode(local_path)
+        # Emit it like a downloaded cover, unless it can't be decoded (e.g. a corrupt file);
+        # the window applies the covers arriving within a frame together.
+        if not img.isNull():
+            self.image_ready.emit(key, img)
 
     # Define a private method to generate a safe local filename for a cover image.
-    def _local_path_for(self, key: str) -> str:
+    def _filename_for(self, key: str) -> str:
         """Generates a safe local filename for the cover image."""
-        # Sanitize the key to create a safe filename, replacing non-alphanumeric characters with underscores.
-        safe_key = "".join(c if c.isalnum() or c in ("_", "-", ".") else "_" for c in key)
-        # Join the covers directory with the safe key and a .png extension to form the full local path.
-        return os.path.join(self.covers_dir, f"{safe_key}.png")
+        # Hash the key into a fixed-length hex name: distinct keys can't collide the way sanitized
+        # names did, and the name is safe on case-insensitive filesystems.
+        return f"{hashlib.blake2b(key.encode('utf-8'), digest_size=12).hexdigest()}.png"
 
-    # Define the worker method that runs in the background thread to download images.
+    # Define a private method to build the full local path for a cover filename.
+    def _local_path_for(self, filename: str) -> str:
+        """Returns the path of a cover file inside the covers directory."""
+        # A single string format is cheaper than os.path.join for this fixed two-part path.
+        return f"{self.covers_dir}{os.sep}{filename}"
+
+    # Define the worker method that runs on a pool thread to download images.
     def _worker(self, key: str, name: str, url: str, local_path: str) -> None:
         """
-        Worker thread that attempts to download an image from a URL or the RAWG API.
+        Pool worker that attempts to download an image from a URL or the RAWG API.
         """
-        # Attempt to download the image from the provided URL if available.
-        if url and self._try_download(url, local_path):
-            # If successful, emit the image_ready signal.
-            self.image_ready.emit(key, local_path)
+        # A cover written after the startup index (e.g. by another instance) is decoded like any cached one.
+        if os.path.exists(local_path):
+            self._decode_cached(key, local_path)
             return
 
-        # If a RAWG API key is available, attempt to fetch the image from the RAWG API.
-        if self.api_key and self._try_fetch_from_rawg(name, local_path):
-            # If successful, emit the image_ready signal.
-            self.image_ready.emit(key, local_path)
-            return
+        # Attempt to download the image from the provided URL, then through the RAWG API if a key is available.
+        downloaded = ((url and self._try_download(url, local_path))
+                      or (self.api_key and self._try_fetch_from_rawg(name, local_path)))
+        if downloaded:
+            # The file was just written successfully: decode it here and emit it if it is a valid image.
+            img = self._decode(local_path)
+            if not img.isNull():
+                self.image_ready.emit(key, img)
+        # If neither method succeeds, nothing is emitted and the card keeps its placeholder.
 
-        # If neither method succeeds, emit the image_ready signal with an empty local path.
-        self.image_ready.emit(key, "")
+    # Define a method that decodes a cover directly at its display size.
+    def _decode(self, path: str) -> QImage:
+        """
+        Decodes an image file, scaled down to fit `decode_size`.
+
+        Runs on the worker thread. QImageReader reads the dimensions from the
+        header first, so formats that support it (e.g. JPEG) decode straight
+        to the smaller size, cutting both decode time and peak memory.
+        """
+        # Create a reader for the image file.
+        reader = QImageReader(path)
+        # Read the original dimensions from the file header.
+        size = reader.size()
+        # Only scale down; smaller covers are left at their original size.
+        if self.decode_size is not None and size.isValid() and (
+            size.width() > self.decode_size.width() or size.height() > self.decode_size.height()
+        ):
+            # Decode to the largest size that fits decode_size, keeping the aspect ratio.
+            reader.setScaledSize(size.scaled(self.decode_size, Qt.KeepAspectRatio))
+        # Decode the image; the result is null if the file can't be read.
+        return reader.read()
 
     # Define a private method to attempt downloading an image from a given URL.
     def _try_download(self, url: str, local_path: str) -> bool:
         """Downloads an image from a URL and saves it locally."""
+        # Create a temporary path for the download to ensure atomic file replacement.
+        tmp_path = f"{local_path}.tmp"
         try:
-            # Make an HTTP GET request to the URL with a timeout and stream enabled.
-            response = requests.get(url, timeout=10, stream=True)
+            # Make an HTTP GET request to the URL with a timeout; streaming defers reading the body
+            # until its size is known.
+            response = _SESSION.get(url, timeout=10, stream=True)
             # Raise an exception for bad HTTP status codes (4xx or 5xx).
             response.raise_for_status()
+            # Get the announced body size, if the server sent one.
+            length = response.headers.get("Content-Length", "")
 
-            # Create a temporary path for the download to ensure atomic file replacement.
-            tmp_path = f"{local_path}.tmp"
             # Open the temporary file in binary write mode.
             with open(tmp_path, "wb") as f:
-                # Iterate over the response content in chunks and write to the file.
-                for chunk in response.iter_content(8192):
-                    f.write(chunk)
+                # Typical covers are small: read the whole body at once and write it with one call.
+                if length.isdigit() and int(length) <= STREAM_THRESHOLD:
+                    f.write(response.content)
+                # Large or unsized bodies are streamed to the file in chunks to bound memory use.
+                else:
+                    for chunk in response.iter_content(65536):
+                        f.write(chunk)
 
             # Atomically replace the old file (if any) with the newly downloaded one.
             os.replace(tmp_path, local_path)
+            # Remember the new cover so later lookups are served from the index.
+            self._existing.add(os.path.basename(local_path))
             # Return True indicating a successful download.
             return True
         # Catch any request-related exceptions.
         except requests.exceptions.RequestException as e:
-            # Print a warning message if the image download fails.
-            print(f"⚠️ Image download failed from {url}: {e}")
-            # Return False indicating a failed download.
-            return False
+            # Log a warning message if the image download fails.
+            log.warning("Image download failed from %s: %s", url, e)
+        # Catch file system errors (disk full, read-only or missing covers directory, locked file).
+        except OSError as e:
+            # Log a warning message if the cover can't be written.
+            log.warning("Could not save cover to %s: %s", local_path, e)
+
+        # Remove a partially written temporary file, if any.
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        # Return False indicating a failed download.
+        return False
 
     # Define a private method to attempt fetching an image from the RAWG API.
     def _try_fetch_from_rawg(self, name: str, local_path: str) -> bool:
@@ -124,25 +442,30 @@ class ImageFetcher(QObject):
             # URL-encode the game name for the API query.
             query = quote_plus(name)
             # Construct the RAWG API URL for searching games.
-            rawg_url = f"https://api.rawg.io/api/games?search={query}&page_size=1&key={self.api_key}"
+            rawg_url = f"https://{RAWG_HOST}/api/games?search={query}&page_size=1&key={self.api_key}"
             # Make an HTTP GET request to the RAWG API with a timeout.
-            response = requests.get(rawg_url, timeout=8)
+            response = _SESSION.get(rawg_url, timeout=8)
             # Raise an exception for bad HTTP status codes.
             response.raise_for_status()
+            # Read the response body.
+            content = response.content
 
-            # Parse the JSON response and get the 'results' array.
-            data = response.json().get("results")
-            # Check if data exists and if the first result has a 'background_image'.
-            if data and data[0].get("background_image"):
-                # Extract the image URL from the API response.
-                image_url = data[0]["background_image"]
+            # Only results[0].background_image is needed (page_size=1), so extract that one field
+            # from the raw payload instead of decoding the whole nested game metadata document.
+            match = _BACKGROUND_IMAGE.search(content)
+            # Check if the first result has a 'background_image' (it is null for games without one).
+            if match:
+                # Decode the JSON string literal to resolve escapes such as "\/".
+                image_url = json_loads(b'"' + match.group(1) + b'"')
                 # Attempt to download the image using the extracted URL.
-                return self._try_download(image_url, local_path)
+                if image_url:
+                    return self._try_download(image_url, local_path)
 
-        # Catch any request-related exceptions.
-        except requests.exceptions.RequestException as e:
-            # Print an error message if fetching from RAWG API fails.
-            print(f"RAWG fetch error for {name}: {e}")
+        # Catch request-related exceptions and malformed escapes in the extracted URL
+        # (json and orjson decode errors are ValueErrors).
+        except (requests.exceptions.RequestException, ValueError) as e:
+            # Log a warning message if fetching from RAWG API fails.
+            log.warning("RAWG fetch error for %s: %s", name, e)
 
         # Return False if fetching from RAWG API fails or no image is found.
         return False
\ No newline at end of file
@@ -11,10 +11,76 @@ import subprocess
 import os
 # Import the threading module for creating and managing threads.
 import threading
+# Import functools for caching the emulators/ directory index.
+import functools
+# Import the logging module for reporting diagnostics.
+import logging
 # Import Optional, Callable, Dict, and Any from the typing module for type hinting.
 from typing import Optional, Callable, Dict, Any
 # Import QMessageBox and QWidget from PyQt5.QtWidgets for GUI elements.
 from PyQt5.QtWidgets import QMessageBox, QWidget
+# Import the Qt classes used to run launches off the GUI thread and report back through signals.
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+# Create a logger for this module.
+log = logging.getLogger(__name__)
+
+# Define the directory where emulators are expected to be located.
+EMULATORS_DIR = "emulators"
+
+
+# Define a cached function that lists the emulators/ directory once per process.
+@functools.lru_cache(maxsize=None)
+def _emulator_dir_index() -> Dict[str, str]:
+    """
+    Builds an index of the files in the `emulators/` folder.
+
+    The result is cached; call `_emulator_dir_index.cache_clear()` after the
+    folder's contents change.
+
+    Returns:
+        Dict[str, str]: Maps each lowercased filename to its path, in directory order.
+    """
+    try:
+        # Scan the directory once; DirEntry.is_file() avoids a separate stat() per entry.
+        with os.scandir(EMULATORS_DIR) as it:
+            return {entry.name.lower(): entry.path for entry in it if entry.is_file()}
+    # A missing emulators directory simply yields an empty index.
+    except FileNotFoundError:
+        return {}
+
+
+# Define a helper that searches the emulators/ directory index for a console's emulator.
+def _match_emulator(console: str) -> Optional[str]:
+    """
+    Looks up an emulator for the console in the cached `emulators/` index.
+
+    Args:
+        console (str): The name of the console to find the emulator for.
+
+    Returns:
+        Optional[str]: The path to the emulator executable, or None if not found.
+    """
+    # Get the cached index of the emulators directory.
+    idx = _emulator_dir_index()
+
+    # ----- Try to find a matching file in the emulators/ folder -----
+    # Lowercase the console name once for the case-insensitive comparison.
+    lconsole = console.lower()
+    # Return the first file whose name contains the console name.
+    for lname, path in idx.items():
+        if lconsole in lname:
+            return path
+
+    # ----- Fallback: if only one .exe is present, assume it -----
+    # Filter the index to include only executable files (ending with .exe).
+    exes = [path for lname, path in idx.items() if lname.endswith(".exe")]
+    # If exactly one executable is found, assume it's the correct emulator and return its path.
+    if len(exes) == 1:
+        return exes[0]
+
+    # No emulator was found in the index.
+    return None
 
 
 # Define a function to find the correct emulator executable for a given console.
@@ -41,37 +107,108 @@ def find_emulator(cfg: Dict[str, Any], console: str) -> Optional[str]:
     if em and os.path.exists(em):
         return em
 
-    # ----- Try to find a matching file in the emulators/ folder -----
-    # Define the directory where emulators are expected to be located.
-    em_dir = "emulators"
-    # Check if the emulators directory exists.
-    if os.path.isdir(em_dir):
-        # Iterate through each file in the emulators directory.
-        for file in os.listdir(em_dir):
-            # Check if the console name is part of the filename (case-insensitive).
-            if console.lower() in file.lower():
-                # Construct the full path to the potential emulator executable.
-                candidate = os.path.join(em_dir, file)
-                # If the candidate path points to an existing file, return it.
-                if os.path.isfile(candidate):
-                    return candidate
+    # ----- Look up the cached emulators/ folder index -----
+    candidate = _match_emulator(console)
+    # If nothing matched, the folder may have changed since it was indexed; rebuild the index once.
+    if candidate is None:
+        _emulator_dir_index.cache_clear()
+        candidate = _match_emulator(console)
+    # Return the emulator found in the emulators/ folder, or None if no method found one.
+    return candidate
 
-    # ----- Fallback: if only one .exe is present, assume it -----
-    try:
-        # Get a list of all files in the emulators directory.
-        files = [os.path.join(em_dir, f) for f in os.listdir(em_dir)]
-        # Filter the list to include only executable files (ending with .exe).
-        exes = [f for f in files if f.lower().endswith(".exe")]
-        # If exactly one executable is found, assume it's the correct emulator and return its path.
-        if len(exes) == 1:
-            return exes[0]
-    # Catch FileNotFoundError if the emulators directory does not exist.
-    except FileNotFoundError:
-        # Pass, as this is a fallback mechanism.
-        pass
 
-    # If no emulator is found through any of the above methods, return None.
-    return None
+# Define the signal carrier through which a background launch reports back to the GUI thread.
+class LaunchSignals(QObject):
+    """
+    Reports the outcome of a launch started by `launch_and_watch`.
+
+    Emits `launch_started(pid)` once the emulator process is running, or
+    `launch_failed(title, message)` if validation or process creation fails.
+    """
+
+    # Define a signal emitted with the process ID once the emulator has started.
+    launch_started = pyqtSignal(int)
+    # Define a signal emitted with a dialog title and message when the launch fails.
+    launch_failed = pyqtSignal(str, str)
+
+
+# Keep the signal carriers of in-progress launches alive until they have reported back.
+_ACTIVE_LAUNCHES = set()
+
+
+# Define a cached function returning the thread pool dedicated to launches.
+@functools.lru_cache(maxsize=None)
+def _launch_pool() -> QThreadPool:
+    """Returns a small thread pool for launches, so they never queue behind cover downloads."""
+    # Create the pool on first use and allow two launches to validate concurrently.
+    pool = QThreadPool()
+    pool.setMaxThreadCount(2)
+    return pool
+
+
+# Define the runnable that validates and starts the emulator on a pool thread.
+class _LaunchTask(QRunnable):
+    """Validates the paths and spawns the emulator without blocking the GUI thread."""
+
+    # Initialize the task with the launch arguments and the signal carrier to report through.
+    def __init__(self, emulator: str, rom_path: str,
+                 on_exit: Optional[Callable[[int], None]], signals: LaunchSignals):
+        # Call the constructor of the parent class (QRunnable).
+        super().__init__()
+        # Store the emulator and ROM paths.
+        self.emulator = emulator
+        self.rom_path = rom_path
+        # Store the optional exit callback.
+        self.on_exit = on_exit
+        # Store the signal carrier used to report the outcome.
+        self.signals = signals
+
+    # Define the method executed by the thread pool.
+    def run(self) -> None:
+        # ----- VALIDATION -----
+        # Check if the emulator executable exists (this may stall on slow or network storage).
+        if not os.path.exists(self.emulator):
+            # Log an error message.
+            log.error("Emulator missing: %s", self.emulator)
+            # Report the failure so the GUI thread can show the error dialog.
+            self.signals.launch_failed.emit("Emulator Missing", f"Emulator not found:\n{self.emulator}")
+            return
+
+        # Check if the ROM file exists.
+        if not os.path.exists(self.rom_path):
+            # Log an error message.
+            log.error("ROM missing: %s", self.rom_path)
+            # Report the failure so the GUI thread can show the error dialog.
+            self.signals.launch_failed.emit("ROM Missing", f"ROM file not found:\n{self.rom_path}")
+            return
+
+        # ----- LAUNCH -----
+        try:
+            # Log a message indicating the emulator and ROM being launched.
+            log.info("Launching emulator: %s (ROM: %s)", self.emulator, self.rom_path)
+            # Launch the emulator as a subprocess with the ROM path as an argument.
+            proc = subprocess.Popen([self.emulator, self.rom_path])
+        # Catch OSError if the subprocess creation fails.
+        except OSError as e:
+            # Log an error message.
+            log.error("Launch error: %s", e)
+            # Report the failure so the GUI thread can show the error dialog.
+            self.signals.launch_failed.emit("Launch Failed", str(e))
+            return
+
+        # ----- WATCH THREAD -----
+        # Define a nested function to watch the launched process.
+        def watcher(p: subprocess.Popen):
+            # Wait for the process to terminate and get its exit code.
+            code = p.wait()
+            # If an on_exit callback function is provided, call it with the exit code.
+            if callable(self.on_exit):
+                self.on_exit(code)
+
+        # Create and start a new daemon thread to run the watcher function, so the pool thread is freed.
+        threading.Thread(target=watcher, args=(proc,), daemon=True).start()
+        # Report the successful launch with the process ID.
+        self.signals.launch_started.emit(proc.pid)
 
 
 # Define a function to launch an emulator and monitor its process.
@@ -80,10 +217,13 @@ def launch_and_watch(
     rom_path: str,
     on_exit: Optional[Callable[[int], None]] = None,
     parent: Optional[QWidget] = None,
-) -> Optional[subprocess.Popen]:
+) -> LaunchSignals:
     """
     Launches an emulator with a ROM file.
-    Runs it in a separate thread and optionally triggers on_exit() when closed.
+    Validation and process creation run on a background thread, so slow
+    storage never blocks the GUI. Failures are shown as message boxes on
+    the GUI thread, and on_exit() is optionally triggered when the
+    emulator closes.
 
     Args:
         emulator (str): The path to the emulator executable.
@@ -92,54 +232,28 @@ def launch_and_watch(
         parent (Optional[QWidget]): The parent widget for displaying message boxes.
 
     Returns:
-        Optional[subprocess.Popen]: The process object for the launched emulator, or None if launch fails.
+        LaunchSignals: Emits launch_started(pid) or launch_failed(title, message) when the launch resolves.
     """
+    # Create the signal carrier in the calling (GUI) thread so its slots run there.
+    signals = LaunchSignals()
+    # Keep the carrier alive until the launch has reported back.
+    _ACTIVE_LAUNCHES.add(signals)
 
-    # ----- VALIDATION -----
-    # Check if the emulator executable exists.
-    if not os.path.exists(emulator):
-        # Display a critical error message box to the user.
-        QMessageBox.critical(parent, "Emulator Missing", f"Emulator not found:\n{emulator}")
-        # Print an error message to the console.
-        print(f"❌ Emulator missing: {emulator}")
-        # Return None as the launch failed.
-        return None
-
-    # Check if the ROM file exists.
-    if not os.path.exists(rom_path):
+    # Define a slot that shows a launch failure on the GUI thread.
+    def show_failure(title: str, message: str):
         # Display a critical error message box to the user.
-        QMessageBox.critical(parent, "ROM Missing", f"ROM file not found:\n{rom_path}")
-        # Print an error message to the console.
-        print(f"❌ ROM missing: {rom_path}")
-        # Return None as the launch failed.
-        return None
+        QMessageBox.critical(parent, title, message)
 
-    # ----- LAUNCH -----
-    try:
-        # Print a message indicating the emulator and ROM being launched.
-        print(f"""🎮 Launching emulator: {emulator}
-   ROM: {rom_path}""")
-        # Launch the emulator as a subprocess with the ROM path as an argument.
-        proc = subprocess.Popen([emulator, rom_path])
-    # Catch OSError if the subprocess creation fails.
-    except OSError as e:
-        # Display a critical error message box to the user.
-        QMessageBox.critical(parent, "Launch Failed", str(e))
-        # Print an error message to the console.
-        print(f"❌ Launch error: {e}")
-        # Return None as the launch failed.
-        return None
-
-    # ----- WATCH THREAD -----
-    # Define a nested function to watch the launched process.
-    def watcher(p: subprocess.Popen):
-        # Wait for the process to terminate and get its exit code.
-        code = p.wait()
-        # If an on_exit callback function is provided, call it with the exit code.
-        if callable(on_exit):
-            on_exit(code)
-
-    # Create and start a new daemon thread to run the watcher function.
-    threading.Thread(target=watcher, args=(proc,), daemon=True).start()
-    # Return the subprocess.Popen object.
-    return proc
+    # Define a slot that releases the carrier once the launch has resolved.
+    def release(*_):
+        _ACTIVE_LAUNCHES.discard(signals)
+
+    # Connect the slots; signals emitted from the pool thread are queued to the GUI thread.
+    signals.launch_failed.connect(show_failure)
+    signals.launch_failed.connect(release)
+    signals.launch_started.connect(release)
+
+    # Validate and spawn the emulator on the launch thread pool.
+    _launch_pool().start(_LaunchTask(emulator, rom_path, on_exit, signals))
+    # Return the signal carrier so callers can react to the outcome.
+    return signals
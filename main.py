@@ -7,6 +7,8 @@ and starts the main window with a Big Picture style interface.
 
 # Import the sys module to access system-specific parameters and functions.
 import sys
+# Import the logging module to configure diagnostics output for all modules.
+import logging
 # Import QApplication for managing the GUI application's control flow and main settings.
 from PyQt5.QtWidgets import QApplication
 # Import the load_config function from the config module to load the application's configuration.
@@ -23,6 +25,8 @@ def main():
     Initializes the QApplication, loads configuration, creates and displays
     the main window, and starts the event loop.
     """
+    # Report warnings and errors from every module to stderr in a compact format.
+    logging.basicConfig(level=logging.WARNING, format="%(levelname)s %(name)s: %(message)s")
     # Load the application's configuration by calling the load_config function.
     cfg = load_config()
     # Create an instance of QApplication, which is required for any GUI application with Qt.
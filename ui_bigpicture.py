@@ -8,157 +8,608 @@ Displays game posters, handles smooth focus animations, and launches games.
 # Import necessary widgets from PyQt5.QtWidgets module.
 from PyQt5.QtWidgets import (
     QMainWindow, QWidget, QLabel, QVBoxLayout, QGridLayout,
-    QScrollArea, QSizePolicy, QGraphicsDropShadowEffect, QMessageBox
+    QScrollArea, QSizePolicy, QGraphicsDropShadowEffect, QGraphicsScene, QGraphicsRectItem, QMessageBox
 )
 # Import necessary classes from PyQt5.QtGui module.
-from PyQt5.QtGui import QPixmap, QFont
+from PyQt5.QtGui import QPixmap, QPixmapCache, QFont, QPainter, QImage, QColor, QPen
 # Import necessary classes from PyQt5.QtCore module.
-from PyQt5.QtCore import Qt, QPropertyAnimation, QEasingCurve, QRect, pyqtSlot, pyqtSignal
-# Import partial for creating partial functions, useful for connecting signals to slots with arguments.
-from functools import partial
-# Import the os module for interacting with the operating system, e.g., for file path operations.
-import os
+from PyQt5.QtCore import (
+    Qt, QPoint, QPropertyAnimation, QEasingCurve, QRectF, QSize, QThread, QTimer, pyqtSlot, pyqtSignal, pyqtProperty
+)
+# Import partial for connecting signals to slots with arguments, and lru_cache for the shared shadow pixmaps.
+from functools import partial, lru_cache
+# Import the logging module for reporting diagnostics.
+import logging
+# Import random for jittering the scroll coalescing interval.
+import random
 
 # Import the ImageFetcher class from the local images module for asynchronous image downloading.
 from images import ImageFetcher
-# Import the scan_roms function from the local games module for discovering available games.
-from games import scan_roms
+# Import the iter_roms generator from the local games module for discovering available games.
+from games import iter_roms
 # Import the find_emulator and launch_and_watch functions from the local launcher module for game execution.
 from launcher import find_emulator, launch_and_watch
 
+# Create a logger for this module.
+log = logging.getLogger(__name__)
+
 # --- UI Constants ---
 # Define the default width and height for a game poster card.
 SMALL_W, SMALL_H = 220, 300
 # Define the expanded width and height for a game poster card when it is focused.
 LARGE_W, LARGE_H = 320, 430
+# Define the scale factor of a focused cover relative to its small size.
+MAX_SCALE = LARGE_W / SMALL_W
 # Define the duration of UI animations in milliseconds.
 ANIM_MS = 200
+# Define the number of cards displayed per grid row.
+PER_ROW = 4
+# Define how long (about one frame) arriving covers are collected before they are applied together.
+COVER_FLUSH_MS = 16
+# Define how many games the background scan reports per signal.
+SCAN_CHUNK = 64
+# Define how many cards are created per event loop tick while the grid fills up.
+CARDS_PER_TICK = PER_ROW * 2
+# Define how long scroll events are coalesced before fetching and reprioritizing covers.
+FETCH_THROTTLE_MS = 50
+# Define the maximum random delay added to that interval, so updates drift off the scroll event cadence.
+FETCH_JITTER_MS = 15
+# Define how long arrow key presses (including auto-repeat) are coalesced into one focus change.
+KEY_DEBOUNCE_MS = 30
+# Define how far (in pixels) above and below the viewport covers are prefetched
+# and cards are created ahead of time.
+PREFETCH_MARGIN = LARGE_H
+# Define the gap between grid rows and columns in pixels.
+GRID_SPACING = 18
+# Define the size (in KiB) of Qt's application-wide pixmap cache, which keeps scaled covers across windows.
+PIXMAP_CACHE_KB = 128 * 1024
+# Define the blur radius of a cover's drop shadow at rest and when focused.
+SHADOW_BLUR_SMALL, SHADOW_BLUR_LARGE = 8, 20
+# Define the shadow's offset and color (QGraphicsDropShadowEffect's defaults).
+SHADOW_OFFSET = 8
+SHADOW_COLOR = QColor(63, 63, 63, 180)
+
+
+# Define a function giving how far a shadow reaches beyond its cover's rect.
+def _shadow_extent(blur):
+    """
+    Returns:
+        tuple: The (lead, trail) in pixels a shadow with this blur radius reaches beyond the cover
+        on its left/top and right/bottom sides; the blur spreads by its radius around the cover's
+        rect shifted down and to the right by SHADOW_OFFSET.
+    """
+    return max(0, blur - SHADOW_OFFSET), blur + SHADOW_OFFSET
+
+
+# Define the room (in pixels) left around a cover at rest, and an enlarged one, for its shadow.
+SHADOW_LEAD_SMALL, SHADOW_TRAIL_SMALL = _shadow_extent(SHADOW_BLUR_SMALL)
+SHADOW_LEAD_LARGE, SHADOW_TRAIL_LARGE = _shadow_extent(SHADOW_BLUR_LARGE)
+# Define the margin (in pixels) between a card's edges and its content.
+CARD_MARGIN = 6
+# Define the grid's margins: how far an enlarged cover and its shadow reach beyond the edges of its card,
+# so covers in the outer rows and columns aren't clipped by the container.
+GRID_MARGIN_X = max(SHADOW_LEAD_LARGE - SHADOW_LEAD_SMALL, SHADOW_TRAIL_LARGE - SHADOW_TRAIL_SMALL) \
+    + (LARGE_W - SMALL_W) // 2 - CARD_MARGIN
+GRID_MARGIN_Y = max(SHADOW_LEAD_LARGE - SHADOW_LEAD_SMALL, SHADOW_TRAIL_LARGE - SHADOW_TRAIL_SMALL) \
+    + (LARGE_H - SMALL_H) // 2 - CARD_MARGIN
+# Define the size policy shared by every cover view (fixed in both directions).
+FIXED_POLICY = QSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
+
+# Define a function that turns a decoded cover image into pixmaps for both card sizes.
+def _covers_from_image(img, dpr=1.0):
+    """
+    Converts a cover decoded by ImageFetcher into small and large pixmaps.
+
+    The image arrives already decoded at (at most) the large card size in
+    device pixels, so the GUI thread only uploads it and scales it down once
+    for the small size. Both pixmaps have exactly the card sizes (covers with
+    a different aspect ratio are letterboxed), so they and their shadows are
+    always blitted 1:1.
+
+    Args:
+        img (QImage): The decoded cover.
+        dpr (float): The screen's device pixel ratio; the pixmaps get this many pixels per logical pixel.
+
+    Returns:
+        tuple: (small, large) QPixmaps.
+    """
+    # Upload the decoded image to a pixmap; this is cheap compared to decoding.
+    pix = QPixmap.fromImage(img)
+    # Fit the image to the large card size in device pixels (a no-op for covers decoded to fit it exactly).
+    large_w, large_h = int(LARGE_W * dpr), int(LARGE_H * dpr)
+    fitted = pix
+    fits_w = pix.width() == large_w and pix.height() <= large_h
+    fits_h = pix.height() == large_h and pix.width() <= large_w
+    if not (fits_w or fits_h):
+        fitted = pix.scaled(large_w, large_h, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+    # Derive the small variant from the fitted image.
+    small_w, small_h = int(SMALL_W * dpr), int(SMALL_H * dpr)
+    small = fitted.scaled(small_w, small_h, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+    # Pad both to the exact card sizes.
+    return _letterbox(small, SMALL_W, SMALL_H, dpr), _letterbox(fitted, LARGE_W, LARGE_H, dpr)
+
+
+# Define a function that centers a pixmap on a card-sized background.
+def _letterbox(pix, w, h, dpr):
+    """
+    Returns `pix` centered on a placeholder-colored pixmap of exactly w×h logical pixels.
+
+    Args:
+        pix (QPixmap): A pixmap that fits in w×h logical pixels, in device pixels at ratio 1.
+        w (int): The logical target width.
+        h (int): The logical target height.
+        dpr (float): The screen's device pixel ratio.
+
+    Returns:
+        QPixmap: The padded pixmap, tagged with `dpr` so Qt blits it 1:1 at its logical size.
+    """
+    # Pixmaps that already have the target size only need the ratio.
+    full_w, full_h = int(w * dpr), int(h * dpr)
+    if pix.width() == full_w and pix.height() == full_h:
+        pix.setDevicePixelRatio(dpr)
+        return pix
+    # Draw the pixmap centered on a background filled like the placeholder, working in device pixels.
+    out = QPixmap(full_w, full_h)
+    out.fill(Qt.darkGray)
+    painter = QPainter(out)
+    painter.drawPixmap((full_w - pix.width()) // 2, (full_h - pix.height()) // 2, pix)
+    painter.end()
+    # Tag the result with the ratio once it has been drawn.
+    out.setDevicePixelRatio(dpr)
+    return out
+
+
+# Define a function that creates a placeholder cover of a logical size for a device pixel ratio.
+def _placeholder(w, h, dpr):
+    """
+    Returns a dark gray pixmap covering w×h logical pixels at the given device pixel ratio.
+    """
+    # Allocate the pixmap in device pixels so it is never rescaled when painted.
+    pix = QPixmap(int(w * dpr), int(h * dpr))
+    pix.setDevicePixelRatio(dpr)
+    # Fill the placeholder pixmap with a dark gray color.
+    pix.fill(Qt.darkGray)
+    return pix
+
+
+# Define a function that returns a pixmap's size in logical (device independent) pixels.
+def _logical_size(pix):
+    """
+    Returns:
+        tuple: The (width, height) of the pixmap divided by its device pixel ratio.
+    """
+    dpr = pix.devicePixelRatioF()
+    return pix.width() / dpr, pix.height() / dpr
+
+
+# Define a function that builds the QPixmapCache key of a game's cover at a given size.
+def _cover_cache_key(game_key, w, h):
+    """
+    Returns the pixmap cache key for a game's cover scaled to w×h.
+
+    Args:
+        game_key (str): The game's unique key.
+        w (int): The cover width.
+        h (int): The cover height.
+
+    Returns:
+        str: The cache key.
+    """
+    return f"{game_key}:{w}x{h}"
+
+
+# Define a function that looks a pixmap up in the application-wide cache.
+def _find_cached(key):
+    """
+    Returns the cached pixmap for a key, or None if it isn't (or is no longer) cached.
+    """
+    # Look the pixmap up; the cache evicts entries once it exceeds its limit.
+    pix = QPixmapCache.find(key)
+    return pix if pix is not None and not pix.isNull() else None
+
+
+# Cache the rendered shadows: every card shares the same two pixmaps.
+@lru_cache(maxsize=None)
+# Define a function that renders the drop shadow of a cover once.
+def _shadow_pixmap(w, h, blur, dpr=1.0):
+    """
+    Renders the drop shadow cast by a w×h cover.
+
+    The blur is computed once, offscreen, by QGraphicsDropShadowEffect; cards
+    then just blit the result instead of blurring themselves on every paint.
+
+    Args:
+        w (int): The cover width.
+        h (int): The cover height.
+        blur (int): The shadow's blur radius.
+        dpr (float): The screen's device pixel ratio.
+
+    Returns:
+        QPixmap: A (w + lead + trail) × (h + lead + trail) logical pixel pixmap, sized to the
+        shadow's extent (see _shadow_extent); the cover's own rect starts at (lead, lead) and
+        is left transparent.
+    """
+    # Build a one-item scene: a cover-sized rect carrying the shadow effect.
+    scene = QGraphicsScene()
+    item = QGraphicsRectItem(0, 0, w, h)
+    item.setBrush(Qt.black)
+    item.setPen(QPen(Qt.NoPen))
+    effect = QGraphicsDropShadowEffect()
+    effect.setBlurRadius(blur)
+    effect.setOffset(SHADOW_OFFSET)
+    effect.setColor(SHADOW_COLOR)
+    item.setGraphicsEffect(effect)
+    scene.addItem(item)
+
+    # Render the scene, padded by the shadow's extent on each side, into a transparent premultiplied
+    # image. The image is allocated in device pixels; the painter works in logical ones.
+    lead, trail = _shadow_extent(blur)
+    full_w, full_h = w + lead + trail, h + lead + trail
+    img = QImage(int(full_w * dpr), int(full_h * dpr), QImage.Format_ARGB32_Premultiplied)
+    img.setDevicePixelRatio(dpr)
+    img.fill(Qt.transparent)
+    painter = QPainter(img)
+    scene.render(painter, QRectF(0, 0, full_w, full_h), QRectF(-lead, -lead, full_w, full_h))
+    # Clear the rect itself; the cover is painted there.
+    painter.setCompositionMode(QPainter.CompositionMode_Clear)
+    painter.fillRect(lead, lead, w, h, Qt.transparent)
+    painter.end()
+    return QPixmap.fromImage(img)
+
+
+# Define the CoverView class, which paints a card's cover at rest.
+class CoverView(QWidget):
+    """
+    Paints a game cover at the small card size, on top of its resting shadow.
+
+    The widget only takes up the small cover and the room for its shadow, so
+    every grid cell keeps its resting size. While a cover is enlarged, a
+    CoverOverlay paints it above the neighbouring cards instead.
+    """
+
+    # Initialize the CoverView with the pre-scaled small and large pixmaps.
+    def __init__(self, small, large, parent=None):
+        # Call the constructor of the parent class (QWidget).
+        super().__init__(parent)
+        # Take up the small cover and its resting shadow only.
+        self.setFixedSize(SMALL_W + SHADOW_LEAD_SMALL + SHADOW_TRAIL_SMALL,
+                          SMALL_H + SHADOW_LEAD_SMALL + SHADOW_TRAIL_SMALL)
+        # Set the size policy to fixed, preventing the cover from resizing with its parent.
+        self.setSizePolicy(FIXED_POLICY)
+        # Store the pixmaps; the large one is painted by the overlay while the card is focused.
+        self.small = small
+        self.large = large
+
+    # Define a method to replace the pixmaps shown by the view.
+    def set_pixmaps(self, small, large):
+        # Store the new pre-scaled pixmaps.
+        self.small = small
+        self.large = large
+        # Repaint with the new cover.
+        self.update()
+
+    # Override paintEvent to draw the shadow and the small cover 1:1.
+    def paintEvent(self, event):
+        # Create a painter for this widget.
+        painter = QPainter(self)
+        # Draw the shared resting shadow, rendered for the screen's ratio; it fills the whole widget.
+        shadow = _shadow_pixmap(SMALL_W, SMALL_H, SHADOW_BLUR_SMALL, self.small.devicePixelRatioF())
+        painter.drawPixmap(0, 0, shadow)
+        # Draw the small pixmap, which has exactly the card size, on top.
+        painter.drawPixmap(SHADOW_LEAD_SMALL, SHADOW_LEAD_SMALL, self.small)
+
+
+# Define the CoverOverlay class, which paints an enlarged cover above the grid.
+class CoverOverlay(QWidget):
+    """
+    Paints one card's cover above the grid, scaled between the small and large card sizes.
+
+    The window keeps one overlay per focus animation, as children of the
+    grid's container. An overlay is centered on its card's cover and only
+    its `scale` property is animated, so focusing a card never resizes a
+    widget or re-lays out the grid; the enlarged cover simply covers the
+    neighbouring cards. At either end of the animation the matching
+    pre-scaled pixmap is drawn 1:1, on top of a pre-rendered shadow;
+    in-between frames are scaled with the fast transform.
+    """
+
+    # Initialize the overlay as a hidden child of the grid's container.
+    def __init__(self, parent):
+        # Call the constructor of the parent class (QWidget).
+        super().__init__(parent)
+        # Reserve the large size plus room for the focused shadow.
+        self.setFixedSize(LARGE_W + SHADOW_LEAD_LARGE + SHADOW_TRAIL_LARGE,
+                          LARGE_H + SHADOW_LEAD_LARGE + SHADOW_TRAIL_LARGE)
+        # The card whose cover is shown, if any.
+        self.card = None
+        # Start at the small size.
+        self._scale = 1.0
+        # Whether the cover casts the focused (larger, softer) shadow.
+        self._raised = False
+        # Stay hidden until a card is shown.
+        self.hide()
+
+    # Define a method that shows a card's cover, starting at the given scale.
+    def show_card(self, card, scale):
+        # Detach from the previous card, unless another overlay has taken it over since.
+        if self.card is not None and self.card.overlay is self:
+            self.card.overlay = None
+        # Attach to the new card, so it keeps the overlay in place and up to date.
+        self.card = card
+        card.overlay = self
+        # Start at the given scale with the resting shadow.
+        self._scale = scale
+        self._raised = False
+        # Center on the card's cover, above the cards, and paint.
+        self.place()
+        self.raise_()
+        self.show()
+        self.update()
+
+    # Define a method that hides the overlay once its card is back at rest.
+    def release(self):
+        # Detach from the card, unless another overlay has taken it over since.
+        if self.card is not None and self.card.overlay is self:
+            self.card.overlay = None
+        self.card = None
+        self.hide()
+
+    # Define a method that centers the overlay's cover on the card's small cover.
+    def place(self):
+        # Map the center of the card's small cover into the container.
+        center = self.card.cover.mapTo(self.parentWidget(),
+                                       QPoint(SHADOW_LEAD_SMALL + SMALL_W // 2, SHADOW_LEAD_SMALL + SMALL_H // 2))
+        # Move the overlay so its own cover center lands there.
+        self.move(center.x() - SHADOW_LEAD_LARGE - LARGE_W // 2, center.y() - SHADOW_LEAD_LARGE - LARGE_H // 2)
+
+    # Define a method to switch between the resting and the focused shadow.
+    def set_raised(self, raised):
+        # Store the state and repaint with the matching shadow.
+        self._raised = raised
+        self.update()
+
+    # Define the getter of the animatable 'scale' property.
+    def get_scale(self):
+        return self._scale
+
+    # Define the setter of the animatable 'scale' property.
+    def set_scale(self, value):
+        # Store the new scale and repaint; nothing about the widget's geometry changes.
+        self._scale = value
+        self.update()
+
+    # Expose 'scale' as a Qt property so QPropertyAnimation can drive it.
+    scale = pyqtProperty(float, fget=get_scale, fset=set_scale)
+
+    # Override mouseReleaseEvent so clicking the enlarged cover activates its card, not the one beneath.
+    def mouseReleaseEvent(self, event):
+        if self.card is not None:
+            self.card.clicked.emit()
+
+    # Define a helper that draws the shared shadow around a cover rect.
+    def _draw_shadow(self, painter, rect, dpr):
+        # Pick the shadow for the current state, rendered for the matching card size and the screen's ratio.
+        if self._raised:
+            w, h, blur = LARGE_W, LARGE_H, SHADOW_BLUR_LARGE
+        else:
+            w, h, blur = SMALL_W, SMALL_H, SHADOW_BLUR_SMALL
+        shadow = _shadow_pixmap(w, h, blur, dpr)
+        # Fit the shadow to the cover rect; at rest covers have the card size, so this is a 1:1 blit.
+        sx = rect.width() / w
+        sy = rect.height() / h
+        lead = _shadow_extent(blur)[0]
+        shadow_w, shadow_h = _logical_size(shadow)
+        painter.drawPixmap(QRectF(rect.x() - lead * sx, rect.y() - lead * sy,
+                                  shadow_w * sx, shadow_h * sy),
+                           shadow, QRectF(shadow.rect()))
+
+    # Override paintEvent to draw the shadow and the cover centered at the current scale.
+    def paintEvent(self, event):
+        # Nothing to paint while no card is shown.
+        if self.card is None:
+            return
+        # Create a painter for this widget.
+        painter = QPainter(self)
+        # Read the card's current pixmaps, so covers arriving mid-animation show up right away.
+        small, large = self.card.cover.small, self.card.cover.large
+        dpr = small.devicePixelRatioF()
+        # The cover is centered on this point, which lies on the card's own cover center.
+        cx, cy = SHADOW_LEAD_LARGE + LARGE_W / 2, SHADOW_LEAD_LARGE + LARGE_H / 2
+        # At either end of the animation, draw the matching pre-scaled pixmap without rescaling.
+        if self._scale <= 1.0 or self._scale >= MAX_SCALE:
+            # Pick the pixmap for the state the cover has settled in.
+            pix = small if self._scale <= 1.0 else large
+            # Center it by its logical size, shadow first.
+            pix_w, pix_h = _logical_size(pix)
+            x = int(cx - pix_w / 2)
+            y = int(cy - pix_h / 2)
+            self._draw_shadow(painter, QRectF(x, y, pix_w, pix_h), dpr)
+            painter.drawPixmap(x, y, pix)
+            return
+
+        # Mid-animation: draw the large pixmap into a rect interpolated between the two card sizes.
+        # These frames last a few milliseconds, so use the painter's default fast (nearest neighbour)
+        # transform; the settled state above shows the smooth-scaled pixmap again.
+        # Convert the scale into animation progress (0 = small, 1 = large).
+        t = (self._scale - 1.0) / (MAX_SCALE - 1.0)
+        # Compute how much of the large pixmap's logical size to draw at this point of the animation.
+        factor = (SMALL_W + t * (LARGE_W - SMALL_W)) / LARGE_W
+        large_w, large_h = _logical_size(large)
+        w = large_w * factor
+        h = large_h * factor
+        # Draw the shadow and the pixmap centered on the cover center.
+        rect = QRectF(cx - w / 2, cy - h / 2, w, h)
+        self._draw_shadow(painter, rect, dpr)
+        painter.drawPixmap(rect, large, QRectF(large.rect()))
+
 
 # Define the PosterCard class, which represents a single game poster in the UI.
 class PosterCard(QWidget):
     """
     Represents a single game poster card.
-    Expands when focused, shrinks when unfocused, and is clickable.
+    Its cover is enlarged by one of the window's overlays while focused, and the card is clickable.
     """
     # Define a custom signal that is emitted when the card is clicked.
     clicked = pyqtSignal()
 
     # Initialize the PosterCard instance.
-    def __init__(self, game, placeholder, parent=None):
+    def __init__(self, game, placeholder, placeholder_large, font, parent=None):
         # Call the constructor of the parent class (QWidget).
         super().__init__(parent)
         # Store the game data associated with this card.
         self.game = game
+        # Whether the card shows the game's real cover rather than the placeholder.
+        self.has_cover = False
+        # Render covers at the placeholder's device pixel ratio, i.e. the screen's.
+        self.dpr = placeholder.devicePixelRatioF()
+        # The window overlay currently showing this card's cover enlarged, if any.
+        self.overlay = None
 
         # --- Layout Setup ---
         # Create a vertical box layout for arranging elements within the card.
         self.layout = QVBoxLayout()
         # Set the margins around the content within the layout.
-        self.layout.setContentsMargins(6, 6, 6, 6)
+        self.layout.setContentsMargins(CARD_MARGIN, CARD_MARGIN, CARD_MARGIN, CARD_MARGIN)
+        # The cover's shadow margin already separates it from the title.
+        self.layout.setSpacing(0)
         # Apply the created layout to this widget.
         self.setLayout(self.layout)
 
         # --- Game Cover ---
-        # Create a QLabel to display the game cover image.
-        self.cover = QLabel()
-        # Set a fixed size for the cover image display area.
-        self.cover.setFixedSize(SMALL_W, SMALL_H)
-        # Enable scaling of the image to fit the label's size.
-        self.cover.setScaledContents(True)
-        # Set an initial placeholder image for the cover.
-        self.cover.setPixmap(placeholder)
-        # Set the size policy to fixed, preventing the cover from resizing with its parent.
-        self.cover.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
-
-        # Add drop shadow for depth
-        # Create a QGraphicsDropShadowEffect for visual depth.
-        self.shadow = QGraphicsDropShadowEffect()
-        # Set the blur radius for the shadow effect.
-        self.shadow.setBlurRadius(8)
-        # Apply the shadow effect to the cover QLabel.
-        self.cover.setGraphicsEffect(self.shadow)
+        # Create a CoverView that paints the cover, starting with the placeholder images.
+        # The view paints its own pre-rendered drop shadow for depth.
+        self.cover = CoverView(placeholder, placeholder_large)
 
         # --- Title Label ---
         # Create a QLabel to display the game title, defaulting to "Unknown" if not found.
         self.title = QLabel(self.game.get("name", "Unknown"))
         # Align the title text to the center.
         self.title.setAlignment(Qt.AlignCenter)
-        # Set the font for the title, making it bold.
-        self.title.setFont(QFont("Consolas", 10, QFont.Bold))
+        # Set the bold title font, shared by all cards.
+        self.title.setFont(font)
+        # Center the title under the cover itself, which sits left of its view's center because
+        # the shadow only reaches out to the right and bottom.
+        self.title.setContentsMargins(0, 0, SHADOW_TRAIL_SMALL - SHADOW_LEAD_SMALL, 0)
 
         # --- Assemble ---
-        # Add the cover QLabel to the layout, centered horizontally.
+        # Add the cover view to the layout, centered horizontally.
         self.layout.addWidget(self.cover, alignment=Qt.AlignCenter)
         # Add the title QLabel to the layout.
         self.layout.addWidget(self.title)
 
-        # --- Animation Setup ---
-        # Create a QPropertyAnimation to animate the 'geometry' property of the cover QLabel.
-        self.anim = QPropertyAnimation(self.cover, b"geometry")
-        # Set the easing curve for a smooth animation effect.
-        self.anim.setEasingCurve(QEasingCurve.OutCubic)
-        # Set the duration of the animation.
-        self.anim.setDuration(ANIM_MS)
+        # Show the cover right away if it is still cached from an earlier window.
+        self.load_cached()
 
     # Override the mouseReleaseEvent to detect clicks on the card.
     def mouseReleaseEvent(self, event):
         # Emit the custom 'clicked' signal when the mouse button is released over the card.
         self.clicked.emit()
 
-    # Define a method to set the cover image of the card.
-    def set_cover(self, path):
-        # Check if the provided image file path exists.
-        if os.path.exists(path):
-            # Create a QPixmap object from the image file.
-            pix = QPixmap(path)
-            # Check if the QPixmap was loaded successfully (not null).
-            if not pix.isNull():
-                # Set the pixmap for the cover QLabel, scaling it to fit while maintaining aspect ratio.
-                self.cover.setPixmap(
-                    pix.scaled(self.cover.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                )
-
-    # Define a method to smoothly expand the card's cover image.
-    def expand(self):
-        # Get the current geometry of the cover QLabel.
-        start = self.cover.geometry()
-        # Calculate the target geometry for the expanded state.
-        end = QRect(
-            start.x() - ((LARGE_W - SMALL_W) // 2),
-            start.y() - ((LARGE_H - SMALL_H) // 2),
-            LARGE_W, LARGE_H
-        )
-        # Stop any ongoing animation to prevent conflicts.
-        self.anim.stop()
-        # Set the starting value of the animation to the current geometry.
-        self.anim.setStartValue(start)
-        # Set the ending value of the animation to the calculated expanded geometry.
-        self.anim.setEndValue(end)
-        # Start the animation.
-        self.anim.start()
-        # Increase the blur radius of the shadow for a more pronounced effect when expanded.
-        self.shadow.setBlurRadius(20)
-
-    # Define a method to smoothly shrink the card's cover image.
-    def shrink(self):
-        # Get the current geometry of the cover QLabel.
-        start = self.cover.geometry()
-        # Calculate the target geometry for the shrunk state.
-        end = QRect(
-            start.x() + ((LARGE_W - SMALL_W) // 2),
-            start.y() + ((LARGE_H - SMALL_H) // 2),
-            SMALL_W, SMALL_H
-        )
-        # Stop any ongoing animation.
-        self.anim.stop()
-        # Set the starting value of the animation to the current geometry.
-        self.anim.setStartValue(start)
-        # Set the ending value of the animation to the calculated shrunk geometry.
-        self.anim.setEndValue(end)
-        # Start the animation.
-        self.anim.start()
-        # Reset the blur radius of the shadow to its default value.
-        self.shadow.setBlurRadius(8)
+    # Define a method to set the cover from an image decoded off the GUI thread.
+    def set_image(self, img):
+        # Ignore null images (no cover could be fetched).
+        if not img.isNull():
+            # Scale the cover for both card sizes.
+            small, large = _covers_from_image(img, self.dpr)
+            # Keep both variants in the application-wide cache for later windows.
+            small_key, large_key = self._cache_keys()
+            QPixmapCache.insert(small_key, small)
+            QPixmapCache.insert(large_key, large)
+            # Hand both size variants to the cover view, and repaint the overlay showing it, if any.
+            self.cover.set_pixmaps(small, large)
+            if self.overlay is not None:
+                self.overlay.update()
+            self.has_cover = True
+
+    # Define a method to show the cover from the pixmap cache, if both sizes are still there.
+    def load_cached(self):
+        """
+        Applies the game's cached cover pixmaps.
+
+        Returns:
+            bool: True if the cover was found in the cache.
+        """
+        # Look up both size variants.
+        small_key, large_key = self._cache_keys()
+        small = _find_cached(small_key)
+        large = _find_cached(large_key)
+        # A partially evicted cover is fetched again like an uncached one.
+        if small is None or large is None:
+            return False
+        # Hand both size variants to the cover view.
+        self.cover.set_pixmaps(small, large)
+        self.has_cover = True
+        return True
+
+    # Define a helper returning the pixmap cache keys of this card's two cover sizes.
+    def _cache_keys(self):
+        # Key by the card sizes in device pixels, so screens with different ratios don't share entries.
+        key = self.game["key"]
+        return (_cover_cache_key(key, int(SMALL_W * self.dpr), int(SMALL_H * self.dpr)),
+                _cover_cache_key(key, int(LARGE_W * self.dpr), int(LARGE_H * self.dpr)))
+
+    # Override moveEvent so an overlay showing this card's cover follows the card.
+    def moveEvent(self, event):
+        super().moveEvent(event)
+        if self.overlay is not None:
+            self.overlay.place()
+
+    # Override resizeEvent too, since resizing the card re-centers its cover.
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        if self.overlay is not None:
+            self.overlay.place()
+
+
+# Define a function giving the neighbour of a grid position in an arrow key's direction.
+def _nav_target(key, i, count):
+    """
+    Returns the index the arrow key `key` moves to from index `i` in a grid of `count` games.
+    """
+    cols = PER_ROW
+    # Left/Right step through the games, wrapping around the ends.
+    if key == Qt.Key_Right:
+        return (i + 1) % count
+    if key == Qt.Key_Left:
+        return (i - 1) % count
+    # Down moves one row, wrapping to the top of the same column.
+    if key == Qt.Key_Down:
+        return i + cols if i + cols < count else i % cols
+    # Up moves one row, wrapping to the last card of the same column.
+    return i - cols if i >= cols else i + (count - 1 - i) // cols * cols
+
+
+# Define the thread that discovers the games without blocking the GUI.
+class _ScanThread(QThread):
+    """
+    Runs iter_roms() in the background and emits `games_found(games)` for
+    every SCAN_CHUNK games found, in the order scan_roms() would return them.
+    """
+    # Define the signal carrying the next chunk of game dictionaries.
+    games_found = pyqtSignal(list)
+
+    # Initialize the thread with the configuration to scan with.
+    def __init__(self, cfg, parent=None):
+        # Call the constructor of the parent class (QThread).
+        super().__init__(parent)
+        # Store the application configuration.
+        self.cfg = cfg
+
+    # Define the method executed on the background thread.
+    def run(self):
+        try:
+            # Iterate over the chunks as the scan produces them (one per console folder, or games.json
+            # as a whole); the scan itself stops waiting for slow folders once interruption is requested.
+            for games in iter_roms(self.cfg, self.isInterruptionRequested):
+                # Split them into signal-sized pieces so the window can start showing cards early.
+                for i in range(0, len(games), SCAN_CHUNK):
+                    # Stop early if the window is closing.
+                    if self.isInterruptionRequested():
+                        return
+                    self.games_found.emit(games[i:i + SCAN_CHUNK])
+        # PyQt aborts the process on exceptions escaping QThread.run(), so report unreadable folders instead.
+        except OSError as e:
+            log.error("ROM scan failed: %s", e)
 
 
 # Define the BigPictureWindow class, which is the main application window.
@@ -175,18 +626,24 @@ class BigPictureWindow(QMainWindow):
         self.setWindowTitle("Retro Launcher — Big Picture")
         # Set the initial position and size of the window.
         self.setGeometry(50, 50, 1280, 800)
+        # Make room in the application-wide pixmap cache for the scaled covers.
+        QPixmapCache.setCacheLimit(PIXMAP_CACHE_KB)
+
+        # Read the screen's device pixel ratio; every pixmap is created at it so Qt blits them 1:1.
+        self.dpr = self.devicePixelRatioF()
 
         # Placeholder cover (grey)
         # Create a QPixmap to serve as a placeholder for game covers.
-        placeholder = QPixmap(SMALL_W, SMALL_H)
-        # Fill the placeholder pixmap with a dark gray color.
-        placeholder.fill(Qt.darkGray)
-        # Store the placeholder pixmap as an instance variable.
-        self.placeholder = placeholder
+        self.placeholder = _placeholder(SMALL_W, SMALL_H, self.dpr)
+        # Create a placeholder at the expanded size too, so focusing a card never rescales it.
+        self.placeholder_large = _placeholder(LARGE_W, LARGE_H, self.dpr)
+        # Create the card title font once (fonts need the application to exist) and share it between all cards.
+        self.title_font = QFont("Consolas", 10, QFont.Bold)
 
         # Asynchronous image fetcher
         # Create an instance of the ImageFetcher to handle downloading game cover images.
-        self.fetcher = ImageFetcher(cfg)
+        # Downloaded covers are decoded on the fetcher's worker threads at the large card size in device pixels.
+        self.fetcher = ImageFetcher(cfg, decode_size=QSize(int(LARGE_W * self.dpr), int(LARGE_H * self.dpr)))
         # Connect the 'image_ready' signal from the fetcher to the 'on_image_ready' slot in this window.
         self.fetcher.image_ready.connect(self.on_image_ready)
 
@@ -201,86 +658,321 @@ class BigPictureWindow(QMainWindow):
         # Make the widget inside the scroll area resizable.
         self.scroll.setWidgetResizable(True)
 
-        # Create a container widget that will hold the grid of game cards.
-        self.container = QWidget()
-        # Create a QGridLayout for arranging game cards in a grid.
-        self.grid = QGridLayout(self.container)
-        # Set the spacing between items in the grid.
-        self.grid.setSpacing(18)
+        # The container widget holding the grid of game cards is created by _populate_grid().
 
-        # Set the container widget as the scroll area's widget.
-        self.scroll.setWidget(self.container)
         # Add the scroll area to the main vertical layout.
         layout.addWidget(self.scroll)
         # Set the root widget as the central widget of the QMainWindow.
         self.setCentralWidget(root)
 
+        # --- Cover Updates ---
+        # Covers that arrived since the last flush, keyed by game key.
+        self._pending = {}
+        # Create a single-shot timer that applies all pending covers in one pass per frame.
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(COVER_FLUSH_MS)
+        self._flush_timer.timeout.connect(self._flush_pending)
+
+        # --- Lazy Cover Loading ---
+        # Create a single-shot timer that coalesces scroll events before fetching visible covers.
+        self._fetch_timer = QTimer(self)
+        self._fetch_timer.setSingleShot(True)
+        # Create the cards and fetch the covers near the viewport when the timer fires.
+        self._fetch_timer.timeout.connect(self._fetch_visible)
+        # Schedule a fetch whenever the grid scrolls.
+        self.scroll.verticalScrollBar().valueChanged.connect(self._schedule_visible_fetch)
+
+        # --- Focus Animation ---
+        # At most two covers animate at once (the card losing focus and the one gaining it),
+        # so the window owns two animations, each driving one of the two overlays created by _populate_grid().
+        self._shrink_anim = self._make_focus_anim(self._on_shrink_finished)
+        self._expand_anim = self._make_focus_anim(self._on_expand_finished)
+
+        # --- Keyboard Navigation ---
+        # Create a single-shot timer that applies the focus change of coalesced key presses once.
+        self._key_timer = QTimer(self)
+        self._key_timer.setSingleShot(True)
+        self._key_timer.setInterval(KEY_DEBOUNCE_MS)
+        self._key_timer.timeout.connect(self._apply_pending_focus)
+
         # --- Load Game Data ---
-        # Scan for available ROMs and load game data using the configuration.
-        self.games = scan_roms(cfg)
-        # Initialize an empty list to store PosterCard objects.
-        self.cards = []
-        # Initialize the index of the currently selected card to 0.
-        self.selected = 0
-
-        # Populate the grid with game poster cards.
+        # The game list grows as the background scan reports chunks of games.
+        self.games = []
+        # PosterCard objects by game index; cards are created lazily for the rows near the viewport
+        # (or the one navigated to), so only some indices have one.
+        self.cards = {}
+        # Index of the created cards by game key, for constant-time cover updates.
+        self._cards_by_key = {}
+        # Height of one grid row (gap included) in pixels, measured once the first card exists.
+        self._row_h = 0
+        # Number of grid rows whose height has been reserved in the current grid.
+        self._reserved_rows = 0
+        # Index of the currently selected card; -1 until the first card has been focused.
+        self.selected = -1
+        # Index the coalesced arrow key presses lead to, applied when the debounce timer fires.
+        self._pending_idx = -1
+        # Whether a tick creating the next cards is already queued.
+        self._chunk_scheduled = False
+
+        # Start with an empty grid; cards are added as games are found.
         self._populate_grid()
 
-        # Highlight the first card if any games were loaded.
-        if self.cards:
-            # Call the _focus method to highlight the first card.
-            self._focus(0)
+        # Scan for available ROMs on a background thread, so the window paints right away.
+        self._scanner = _ScanThread(cfg, self)
+        self._scanner.games_found.connect(self._on_games_found)
+        self._scanner.start()
 
     # ----- UI Construction -----
     # Define a method to populate the grid layout with game poster cards.
     def _populate_grid(self):
-        # Iterate through existing items in the grid in reverse order to remove them.
-        for i in reversed(range(self.grid.count())):
-            # Get the widget at the current grid index.
-            w = self.grid.itemAt(i).widget()
-            # If a widget exists, remove it from its parent (and thus from the layout).
-            if w:
-                w.setParent(None)
-
-        # Initialize row and column counters for grid placement.
-        r = c = 0
-        # Define the number of cards to display per row.
-        per_row = 4
-
-        # Iterate through the list of games with their index.
-        for idx, g in enumerate(self.games):
-            # Create a PosterCard for each game, using the placeholder image.
-            card = PosterCard(g, self.placeholder)
+        # Stop the focus animations before their target overlays go away.
+        self._shrink_anim.stop()
+        self._expand_anim.stop()
+
+        # Create a fresh container widget that will hold the grid of game cards.
+        self.container = QWidget()
+        # Create a QGridLayout for arranging game cards in a grid.
+        self.grid = QGridLayout(self.container)
+        # Space the columns; rows get no layout spacing, since every row's full height (gap included) is
+        # reserved with setRowMinimumHeight, so rows whose cards don't exist yet still take up their space.
+        self.grid.setHorizontalSpacing(GRID_SPACING)
+        self.grid.setVerticalSpacing(0)
+        # Leave room around the grid for enlarged covers in the outer rows and columns.
+        self.grid.setContentsMargins(GRID_MARGIN_X, GRID_MARGIN_Y, GRID_MARGIN_X, GRID_MARGIN_Y)
+        # Create the overlays that paint the shrinking and the expanding cover above the cards.
+        self._shrink_overlay = CoverOverlay(self.container)
+        self._expand_overlay = CoverOverlay(self.container)
+        # Swap it into the scroll area; Qt deletes the previous container together with all of its
+        # cards at once, instead of detaching them from the layout one by one.
+        self.scroll.setWidget(self.container)
+
+        # Forget the removed cards and the selection.
+        self.cards = {}
+        self._cards_by_key = {}
+        self.selected = -1
+        # Reserve the rows of the games known so far in the new grid.
+        self._reserved_rows = 0
+        self._reserve_rows()
+        # Rebuild the keyboard navigation tables for the new game list.
+        self._nav = {key: [] for key in (Qt.Key_Right, Qt.Key_Left, Qt.Key_Down, Qt.Key_Up)}
+        self._extend_nav(0)
+
+        # Create the cards for the games known so far over the next event loop ticks.
+        self._schedule_chunk()
+
+    # ----- Incremental Loading -----
+    # Decorate the method as a PyQt slot that accepts a list of games.
+    @pyqtSlot(list)
+    # Define the slot that receives the games found by the background scan.
+    def _on_games_found(self, games):
+        # Append the games and extend the navigation tables to cover them.
+        old_count = len(self.games)
+        self.games.extend(games)
+        self._extend_nav(old_count)
+        # Reserve their rows, and create their cards if they fall within (or near) the viewport.
+        self._reserve_rows()
+        self._schedule_chunk()
+
+    # Define a method that queues the next card-creating tick unless one is already queued.
+    def _schedule_chunk(self):
+        if not self._chunk_scheduled:
+            self._chunk_scheduled = True
+            QTimer.singleShot(0, self._add_next_chunk)
+
+    # Define a method that creates a few more of the cards needed to fill the viewport.
+    def _add_next_chunk(self):
+        self._chunk_scheduled = False
+        # Remember whether this tick creates the very first cards.
+        first = not self.cards
+        # Create at most CARDS_PER_TICK cards, so input and painting keep flowing between ticks;
+        # the rest are created as the user scrolls or navigates towards them.
+        view_h = max(self.scroll.viewport().height(), self.height())
+        self._materialize(self._missing_indices(self._viewport_rows(view_h))[:CARDS_PER_TICK])
+        # Highlight the first card as soon as it exists.
+        if first and self.cards:
+            self._focus(0)
+        # Continue on the next tick while rows near the viewport still lack cards.
+        if self._missing_indices(self._viewport_rows(view_h)):
+            self._schedule_chunk()
+        # Fetch the covers of the new cards once they have been laid out.
+        self._schedule_visible_fetch()
+
+    # Define a method that extends the arrow-key navigation tables to the games added since the last call.
+    def _extend_nav(self, old_count):
+        """
+        Updates the keyboard navigation tables after the game list grew from `old_count` games.
+
+        Each table maps Qt.Key_Left/Right/Up/Down to a list giving the target index
+        for each index. Left/Right step through the games and wrap around the ends;
+        Up/Down move one row and wrap to the other end of the same column, which on
+        a short last row is the column's last card rather than a modulo jump.
+
+        Only the new tail is computed, plus the few old entries whose wrap-around
+        target moved: the last card's Right, the first card's Left, the old last
+        row's Down, and the first row's Up.
+        """
+        count = len(self.games)
+        cols = PER_ROW
+        # Old entries that wrap around the end of the list, whose targets depend on the game count.
+        stale = set(range(max(0, old_count - cols), old_count)) | set(range(min(cols, old_count)))
+        # Iterate over the four direction tables.
+        for key, table in self._nav.items():
+            # Recompute the stale entries, then append the new games.
+            for i in stale:
+                table[i] = _nav_target(key, i, count)
+            table.extend(_nav_target(key, i, count) for i in range(old_count, count))
+
+    # Define a method that creates the cards for the given game indices.
+    def _materialize(self, indices):
+        # Iterate through the requested games.
+        for idx in indices:
+            # Skip games that already have a card.
+            if idx in self.cards:
+                continue
+            # Get the game for this grid position.
+            g = self.games[idx]
+            # Create a PosterCard for the game, using the placeholder images and the shared title font.
+            card = PosterCard(g, self.placeholder, self.placeholder_large, self.title_font)
             # Connect the card's 'clicked' signal to the '_on_card_clicked' slot, passing the card's index.
             card.clicked.connect(partial(self._on_card_clicked, idx))
-            # Add the card to the grid layout at the current row and column.
-            self.grid.addWidget(card, r, c)
-            # Add the created card to the list of cards.
-            self.cards.append(card)
+            # Add the card to the grid layout at its row and column, at the top of its reserved row.
+            self.grid.addWidget(card, idx // PER_ROW, idx % PER_ROW, alignment=Qt.AlignTop)
+            # Add the created card to the cards and index it by game key.
+            self.cards[idx] = card
+            self._cards_by_key[g["key"]] = card
+
+        # New cards are stacked above their older siblings, so keep the overlays on top (the expanding one last).
+        if indices:
+            self._shrink_overlay.raise_()
+            self._expand_overlay.raise_()
+
+        # Measure the row height once, from the first card (all cards have the same fixed size),
+        # and reserve the height of every row.
+        if not self._row_h and self.cards:
+            self._row_h = next(iter(self.cards.values())).sizeHint().height() + GRID_SPACING
+            self._reserve_rows()
+
+    # Define a method that reserves the height of the grid rows added since the last call.
+    def _reserve_rows(self):
+        # Nothing to reserve until the row height is known.
+        if not self._row_h:
+            return
+        # Give every row of the game list its full height, so the grid (and the scroll range) has its
+        # final size and each card lands at its final position whichever rows have cards.
+        rows = (len(self.games) + PER_ROW - 1) // PER_ROW
+        for r in range(self._reserved_rows, rows):
+            self.grid.setRowMinimumHeight(r, self._row_h)
+        self._reserved_rows = max(self._reserved_rows, rows)
+
+    # Define a method that creates the cards in and around the viewport.
+    def _materialize_to_viewport(self, view_h=None):
+        # Nothing to do until the row height is known.
+        if not self._row_h:
+            return
+        # Create the missing cards of the rows in range.
+        self._materialize(self._missing_indices(self._viewport_rows(view_h)))
+
+    # Define a method that computes the grid rows within the viewport plus a margin on both sides.
+    def _viewport_rows(self, view_h=None):
+        # Until the row height is known, ask for the first row so it can be measured.
+        if not self._row_h:
+            return range(0, 1)
+        # Use the viewport height unless the caller knows better (e.g. before the window is laid out).
+        if view_h is None:
+            view_h = self.scroll.viewport().height()
+        # Compute the container y range that should have cards.
+        top = self.scroll.verticalScrollBar().value()
+        first = max(0, (top - PREFETCH_MARGIN) // self._row_h)
+        last = (top + view_h + PREFETCH_MARGIN) // self._row_h
+        return range(first, last + 1)
+
+    # Define a method that lists the game indices in the given rows that don't have a card yet.
+    def _missing_indices(self, rows):
+        # Clip the rows to the end of the game list.
+        count = len(self.games)
+        return [idx for r in rows for idx in range(r * PER_ROW, min((r + 1) * PER_ROW, count))
+                if idx not in self.cards]
+
+    # ----- Lazy Cover Loading -----
+    # Define a slot that schedules fetching covers for the cards near the viewport.
+    def _schedule_visible_fetch(self, *_):
+        # Let an already scheduled fetch absorb this event so scrolling triggers at most one per interval.
+        if not self._fetch_timer.isActive():
+            self._fetch_timer.start(FETCH_THROTTLE_MS + random.randint(0, FETCH_JITTER_MS))
 
-            # Start asynchronous image download for the game's cover if an image URL is available.
-            self.fetcher.fetch(g["key"], g["name"], g.get("image_url"))
+    # Define a method that requests covers for the cards near the viewport, most visible first.
+    def _fetch_visible(self):
+        # Create the cards that scrolled into range first, so their covers are requested too.
+        self._materialize_to_viewport()
+        # Compute the visible span in container coordinates.
+        top = self.scroll.verticalScrollBar().value()
+        bottom = top + self.scroll.viewport().height()
+        # Give each card a priority: 0 when visible, otherwise the number of rows it is away from the viewport.
+        priorities = {}
+        nearby = []
+        for card in self.cards.values():
+            geo = card.geometry()
+            if geo.bottom() < top:
+                priority = (top - geo.bottom()) // self._row_h + 1
+            elif geo.top() > bottom:
+                priority = (geo.top() - bottom) // self._row_h + 1
+            else:
+                priority = 0
+            priorities[card.game["key"]] = priority
+            # Cards within the prefetch margin are requested now, unless their cover came from the pixmap cache.
+            near = geo.bottom() >= top - PREFETCH_MARGIN and geo.top() <= bottom + PREFETCH_MARGIN
+            if near and not card.has_cover:
+                nearby.append(card.game)
+        # Push covers that scrolled away behind the visible ones, then request the new ones.
+        self.fetcher.reprioritize(priorities)
+        self.fetcher.prefetch(nearby, priorities)
 
-            # Increment the column counter.
-            c += 1
-            # If the current row is full, reset the column counter and move to the next row.
-            if c >= per_row:
-                c = 0
-                r += 1
+    # Override resizeEvent so enlarging the window fetches the newly exposed covers.
+    def resizeEvent(self, ev):
+        # Let QMainWindow handle the resize itself.
+        super().resizeEvent(ev)
+        # Schedule a fetch for whatever is visible at the new size.
+        self._schedule_visible_fetch()
+
+    # Override closeEvent to stop the background scan before the window goes away.
+    def closeEvent(self, ev):
+        # Ask the scan to stop and wait for the thread; it checks for the request between chunks and
+        # every games.STOP_POLL_S seconds while waiting for a folder scan.
+        self._scanner.requestInterruption()
+        self._scanner.wait()
+        # Cancel the queued cover downloads so exiting doesn't wait for them.
+        self.fetcher.shutdown()
+        # Let QMainWindow handle the close itself.
+        super().closeEvent(ev)
 
     # ----- Image Handler -----
-    # Decorate the method as a PyQt slot that accepts two string arguments (key and path).
-    @pyqtSlot(str, str)
+    # Decorate the method as a PyQt slot that accepts a key and a decoded image.
+    @pyqtSlot(str, QImage)
     # Define the slot to handle the 'image_ready' signal from the ImageFetcher.
-    def on_image_ready(self, key, path):
-        # Iterate through all existing PosterCard objects.
-        for card in self.cards:
-            # If the game key of the card matches the key received from the signal.
-            if card.game["key"] == key:
-                # Set the downloaded image as the cover for this card.
-                card.set_cover(path)
-                # Exit the loop once the matching card is found and updated.
-                break
+    def on_image_ready(self, key, img):
+        # The fetcher only emits covers that were downloaded or found cached, and decoded successfully.
+        # Queue the cover for the next flush instead of updating the card right away.
+        self._pending[key] = img
+        self._schedule_flush()
+
+    # Define a method that starts the flush timer unless a flush is already scheduled.
+    def _schedule_flush(self):
+        # Covers arriving while the timer runs join the already scheduled flush.
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    # Define a method that applies all pending covers in a single pass.
+    def _flush_pending(self):
+        # Take the pending covers so new arrivals start the next batch.
+        pending, self._pending = self._pending, {}
+        # Look each cover's card up by key in O(1) instead of scanning all cards.
+        for key, img in pending.items():
+            card = self._cards_by_key.get(key)
+            if card:
+                card.set_image(img)
+        # Repaint the grid once for the whole batch.
+        self.container.update()
 
     # ----- Keyboard Navigation -----
     # Override the keyPressEvent method to handle keyboard input for navigation.
@@ -289,56 +981,110 @@ class BigPictureWindow(QMainWindow):
         if not self.cards:
             return
 
-        # Define the number of columns in the grid for navigation calculations.
-        cols = 4
-        # Get the index of the currently selected card.
-        idx = self.selected
-
-        # Handle Right arrow key press.
-        if ev.key() == Qt.Key_Right:
-            # Move to the next card, wrapping around to the beginning if at the end.
-            idx = (idx + 1) % len(self.cards)
-        # Handle Left arrow key press.
-        elif ev.key() == Qt.Key_Left:
-            # Move to the previous card, wrapping around to the end if at the beginning.
-            idx = (idx - 1) % len(self.cards)
-        # Handle Down arrow key press.
-        elif ev.key() == Qt.Key_Down:
-            # Move down one row, wrapping around if at the bottom.
-            idx = (idx + cols) % len(self.cards)
-        # Handle Up arrow key press.
-        elif ev.key() == Qt.Key_Up:
-            # Move up one row, wrapping around if at the top.
-            idx = (idx - cols) % len(self.cards)
+        # Look up the neighbour in the pressed direction; navigation covers all games,
+        # including ones whose card hasn't been created yet.
+        table = self._nav.get(ev.key())
+        if table is not None:
+            # Step from the target of the presses still being coalesced, if any.
+            current = self._pending_idx if self._key_timer.isActive() else self.selected
+            self._pending_idx = table[current]
+            # Apply the focus change once per interval, however fast the key repeats.
+            if not self._key_timer.isActive():
+                self._key_timer.start()
         # Handle Enter or Return key press.
         elif ev.key() in (Qt.Key_Return, Qt.Key_Enter):
+            # Apply a pending focus change first, so the game the user navigated to is played.
+            if self._key_timer.isActive():
+                self._key_timer.stop()
+                self._apply_pending_focus()
             # Play the game associated with the currently selected card.
             self._play(self.cards[self.selected].game)
-            # Return to prevent further processing of this key event.
-            return
 
-        # After handling navigation keys, focus on the newly calculated index.
-        self._focus(idx)
+    # Define a slot that focuses the card the coalesced key presses lead to.
+    def _apply_pending_focus(self):
+        self._focus(self._pending_idx)
 
     # ----- Focus Animation -----
     # Define a method to manage the focus state and animation of cards.
     def _focus(self, idx):
-        # If there are no cards, do nothing.
-        if not self.cards:
+        # If there are no cards, or the card is already focused, do nothing.
+        if not self.cards or idx == self.selected:
             return
-        # Shrink previous
-        # Check if the previously selected index is valid.
-        if 0 <= self.selected < len(self.cards):
-            # Shrink the card that was previously focused.
-            self.cards[self.selected].shrink()
+        # Get the previously focused card, if any.
+        old = self.cards.get(self.selected)
 
-        # Expand new
+        # If navigation jumped to a card that doesn't exist yet (e.g. wrapping to the end of the
+        # library), create only the target's row; the rows in between stay empty but reserved.
+        created = idx not in self.cards
+        if created:
+            row = idx // PER_ROW
+            self._materialize(self._missing_indices(range(row, row + 1)))
         # Update the selected index to the new index.
         self.selected = idx
-        # Expand the newly selected card.
-        self.cards[self.selected].expand()
-        # Ensure the newly selected card is visible within the scroll area, with some margin.
-        self.scroll.ensureWidgetVisible(self.cards[self.selected], xMargin=40, yMargin=40)
+        # Shrink the previous card and expand the newly selected one.
+        self._animate_focus(old, self.cards[self.selected])
+        # Ensure the enlarged cover is visible within the scroll area, with some margin; freshly
+        # created cards (and so the overlay following them) are only positioned once the layout runs,
+        # so wait for it.
+        overlay = self._expand_overlay
+        if created:
+            QTimer.singleShot(0, lambda: self.scroll.ensureWidgetVisible(overlay, xMargin=40, yMargin=40))
+        else:
+            self.scroll.ensureWidgetVisible(overlay, xMargin=40, yMargin=40)
+
+    # Define a method that creates one of the two shared focus animations.
+    def _make_focus_anim(self, on_finished):
+        # Create a QPropertyAnimation of an overlay's 'scale' property; unlike 'geometry',
+        # this never invalidates the grid layout. Its target is set for each focus change.
+        anim = QPropertyAnimation(self)
+        anim.setPropertyName(b"scale")
+        # Set the easing curve for a smooth animation effect.
+        anim.setEasingCurve(QEasingCurve.OutCubic)
+        # Set the duration of the animation.
+        anim.setDuration(ANIM_MS)
+        # Let the animated overlay settle once the cover has reached its target scale.
+        anim.finished.connect(on_finished)
+        return anim
+
+    # Define a method that animates a focus change from one card to another.
+    def _animate_focus(self, old, new):
+        # Stop both animations where they are.
+        self._shrink_anim.stop()
+        self._expand_anim.stop()
+        # A card that is still shrinking grows back from its current scale; any other starts at rest.
+        start = self._shrink_overlay.scale if self._shrink_overlay.card is new else 1.0
+
+        # Hand the previously focused card, if any, from the expand overlay to the shrink overlay at its
+        # current scale and shrink it; a card that was still shrinking there is left at rest right away.
+        if old is not None:
+            self._shrink_overlay.show_card(old, self._expand_overlay.scale)
+            self._run_focus_anim(self._shrink_anim, self._shrink_overlay, 1.0)
+        else:
+            self._shrink_overlay.release()
+        # Show the new card in the expand overlay and grow it.
+        self._expand_overlay.show_card(new, start)
+        self._run_focus_anim(self._expand_anim, self._expand_overlay, MAX_SCALE)
+
+    # Define a helper that points a shared focus animation at an overlay and starts it.
+    def _run_focus_anim(self, anim, overlay, scale):
+        # Target the overlay.
+        anim.setTargetObject(overlay)
+        # Start from the current scale, so an interrupted animation continues smoothly.
+        anim.setStartValue(overlay.scale)
+        # Set the ending value of the animation to the target scale.
+        anim.setEndValue(scale)
+        # Start the animation.
+        anim.start()
+
+    # Define a slot called when the shrink animation has finished.
+    def _on_shrink_finished(self):
+        # The card is back at rest and painted by its own cover view again.
+        self._shrink_overlay.release()
+
+    # Define a slot called when the expand animation has finished.
+    def _on_expand_finished(self):
+        # Raise the larger, softer shadow once the cover has settled, rather than on every animation frame.
+        self._expand_overlay.set_raised(True)
 
     # ----- Click Action -----
     # Define a slot to handle clicks on individual PosterCard objects.
@@ -361,8 +1107,8 @@ class BigPictureWindow(QMainWindow):
         if not console or not rom_path:
             # Display a critical error message to the user.
             QMessageBox.critical(self, "Invalid Game", "Game is missing required information (console or path).")
-            # Print an error message to the console.
-            print("❌ Invalid game:", game)
+            # Log an error message.
+            log.error("Invalid game: %s", game)
             # Stop the launch process.
             return
 
@@ -372,21 +1118,13 @@ class BigPictureWindow(QMainWindow):
         if not em:
             # Display a warning message to the user if no emulator is configured.
             QMessageBox.warning(self, "No Emulator", f"No emulator configured for {console}.")
-            # Print an error message to the console.
-            print("❌ Emulator not found for:", console)
-            # Stop the launch process.
-            return
-
-        # Check if the ROM file actually exists at the specified path.
-        if not os.path.exists(rom_path):
-            # Display a warning message to the user if the ROM file is not found.
-            QMessageBox.warning(self, "ROM Not Found", f"ROM file not found:\n{rom_path}")
-            # Print an error message to the console.
-            print("❌ ROM not found:", rom_path)
+            # Log an error message.
+            log.error("Emulator not found for: %s", console)
             # Stop the launch process.
             return
 
-        # Print a message to the console indicating the game being launched.
-        print(f"🎮 Launching {game['name']} ({console}) with {em}")
-        # Launch the emulator with the ROM and set up a callback for when the game exits.
-        launch_and_watch(em, rom_path, on_exit=lambda rc: print(f"Game exited with code {rc}"), parent=self)
+        # Log a message indicating the game being launched.
+        log.info("Launching %s (%s) with %s", game['name'], console, em)
+        # Launch the emulator with the ROM and set up a callback for when the game exits;
+        # launch_and_watch checks that the ROM exists off the GUI thread and reports failures itself.
+        launch_and_watch(em, rom_path, on_exit=lambda rc: log.info("Game exited with code %d", rc), parent=self)